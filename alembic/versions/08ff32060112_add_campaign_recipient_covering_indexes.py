@@ -0,0 +1,75 @@
+"""Replace campaign_recipients single-column indexes with per-campaign covering ones
+
+Revision ID: 08ff32060112
+Revises: 09366e0442b6
+Create Date: 2026-10-15 17:05:38.912640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '08ff32060112'
+down_revision: Union[str, Sequence[str], None] = '09366e0442b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns, include) for the per-campaign covering indexes
+COVERING_INDEXES = [
+    ('ix_recipients_campaign_status', ['campaign_id', 'send_status'], ['sent_at']),
+    ('ix_recipients_campaign_opened', ['campaign_id', 'opened'], ['open_count']),
+    ('ix_recipients_campaign_clicked', ['campaign_id', 'clicked'], ['click_count']),
+]
+
+# (name, columns) of the single-column indexes they replace; campaign_id alone
+# is served by the leading column of the new indexes and uq_campaign_contact
+OLD_INDEXES = [
+    ('ix_campaign_recipients_campaign_id', ['campaign_id']),
+    ('ix_campaign_recipients_send_status', ['send_status']),
+    ('ix_campaign_recipients_opened', ['opened']),
+    ('ix_campaign_recipients_clicked', ['clicked']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, columns, include in COVERING_INDEXES:
+            op.create_index(
+                name,
+                'campaign_recipients',
+                columns,
+                unique=False,
+                postgresql_include=include,
+                postgresql_concurrently=True
+            )
+        for name, _ in OLD_INDEXES:
+            op.drop_index(
+                name,
+                table_name='campaign_recipients',
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in OLD_INDEXES:
+            op.create_index(
+                name,
+                'campaign_recipients',
+                columns,
+                unique=False,
+                postgresql_concurrently=True
+            )
+        for name, _, _ in reversed(COVERING_INDEXES):
+            op.drop_index(
+                name,
+                table_name='campaign_recipients',
+                postgresql_concurrently=True
+            )
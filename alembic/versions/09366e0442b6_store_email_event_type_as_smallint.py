@@ -0,0 +1,81 @@
+"""Store email_events.event_type as a SMALLINT code
+
+Revision ID: 09366e0442b6
+Revises: ae39c2399b0b
+Create Date: 2026-10-15 16:41:57.203816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '09366e0442b6'
+down_revision: Union[str, Sequence[str], None] = 'ae39c2399b0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, code) pairs, must match models.analytics.EmailEventType
+EVENT_TYPES = [
+    ('sent', 1),
+    ('delivered', 2),
+    ('opened', 3),
+    ('clicked', 4),
+    ('bounced', 5),
+    ('unsubscribed', 6),
+    ('complained', 7),
+]
+
+
+def _case(column: str, pairs: list) -> str:
+    whens = ' '.join(f"WHEN {src!r} THEN {dst!r}" for src, dst in pairs)
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The partial index predicate compares against the old string value; the
+    # lookup index is rebuilt by ALTER COLUMN TYPE on its own
+    op.drop_index('idx_email_events_bounce', table_name='email_events')
+    op.alter_column(
+        'email_events',
+        'event_type',
+        type_=sa.SmallInteger(),
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using=_case('event_type', EVENT_TYPES),
+        comment='EmailEventType code: 1 sent, 2 delivered, 3 opened, 4 clicked, 5 bounced, 6 unsubscribed, 7 complained',
+        existing_comment='Event type: sent, delivered, opened, clicked, bounced, unsubscribed, complained'
+    )
+    op.create_index(
+        'idx_email_events_bounce',
+        'email_events',
+        ['campaign_recipient_id'],
+        unique=False,
+        postgresql_where=sa.text('event_type = 5')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_email_events_bounce', table_name='email_events')
+    op.alter_column(
+        'email_events',
+        'event_type',
+        type_=sa.String(length=50),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_case('event_type', [(code, name) for name, code in EVENT_TYPES]),
+        comment='Event type: sent, delivered, opened, clicked, bounced, unsubscribed, complained',
+        existing_comment='EmailEventType code: 1 sent, 2 delivered, 3 opened, 4 clicked, 5 bounced, 6 unsubscribed, 7 complained'
+    )
+    op.create_index(
+        'idx_email_events_bounce',
+        'email_events',
+        ['campaign_recipient_id'],
+        unique=False,
+        postgresql_where=sa.text("event_type = 'bounced'")
+    )
@@ -0,0 +1,67 @@
+"""Replace the email_templates is_current index with a partial unique index per campaign
+
+Revision ID: 1fb2f4b21b82
+Revises: e8217a98b1ad
+Create Date: 2026-10-15 19:34:12.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1fb2f4b21b82'
+down_revision: Union[str, Sequence[str], None] = 'e8217a98b1ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The unique index would fail on campaigns with several current versions;
+    # keep only the newest one current
+    op.execute("""
+        UPDATE email_templates t
+        SET is_current = false
+        WHERE is_current
+          AND EXISTS (
+              SELECT 1 FROM email_templates newer
+              WHERE newer.campaign_id = t.campaign_id
+                AND newer.is_current
+                AND newer.version > t.version
+          )
+    """)
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_templates_current_by_campaign',
+            'email_templates',
+            ['campaign_id'],
+            unique=True,
+            postgresql_where=sa.text('is_current'),
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_email_templates_is_current',
+            table_name='email_templates',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_templates_is_current',
+            'email_templates',
+            ['is_current'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_templates_current_by_campaign',
+            table_name='email_templates',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,67 @@
+"""Add organization-scoped campaign listing indexes
+
+Revision ID: 2b5e5c01bcf8
+Revises: f3f0193055c0
+Create Date: 2026-10-15 11:03:27.514902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b5e5c01bcf8'
+down_revision: Union[str, Sequence[str], None] = 'f3f0193055c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns) for each list_campaigns filter/sort combination
+CAMPAIGN_LIST_INDEXES = [
+    ('ix_campaigns_org_status_created', ['organization_id', 'status', sa.text('created_at DESC')]),
+    ('ix_campaigns_org_created', ['organization_id', sa.text('created_at DESC')]),
+    ('ix_campaigns_org_updated', ['organization_id', sa.text('updated_at DESC')]),
+    ('ix_campaigns_org_name', ['organization_id', 'name']),
+    ('ix_campaigns_org_scheduled', ['organization_id', 'scheduled_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, columns in CAMPAIGN_LIST_INDEXES:
+            op.create_index(
+                name,
+                'campaigns',
+                columns,
+                unique=False,
+                postgresql_using='btree',
+                postgresql_concurrently=True
+            )
+        # Covered by the leading column of the new indexes
+        op.drop_index(
+            op.f('ix_campaigns_organization_id'),
+            table_name='campaigns',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_campaigns_organization_id'),
+            'campaigns',
+            ['organization_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        for name, _ in reversed(CAMPAIGN_LIST_INDEXES):
+            op.drop_index(
+                name,
+                table_name='campaigns',
+                postgresql_concurrently=True
+            )
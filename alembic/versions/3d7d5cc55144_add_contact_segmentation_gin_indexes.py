@@ -0,0 +1,50 @@
+"""Add GIN indexes on contacts tags and custom_fields
+
+Revision ID: 3d7d5cc55144
+Revises: fe3ed46a8bc6
+Create Date: 2026-10-15 17:58:42.301176
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7d5cc55144'
+down_revision: Union[str, Sequence[str], None] = 'fe3ed46a8bc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_tags_gin',
+            'contacts',
+            ['tags'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+        # jsonb_path_ops: smaller and faster for @> containment, which is the
+        # only operator segmentation queries use
+        op.create_index(
+            'ix_contacts_custom_fields_gin',
+            'contacts',
+            ['custom_fields'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'custom_fields': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_custom_fields_gin', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_tags_gin', table_name='contacts', postgresql_concurrently=True)
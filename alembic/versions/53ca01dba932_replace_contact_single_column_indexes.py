@@ -0,0 +1,55 @@
+"""Replace contacts single-column indexes with (organization_id, subscription_status)
+
+Revision ID: 53ca01dba932
+Revises: a1bd3c2007c6
+Create Date: 2026-10-15 20:31:05.842716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '53ca01dba932'
+down_revision: Union[str, Sequence[str], None] = 'a1bd3c2007c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns) of the indexes being dropped; organization_id and
+# (organization_id, email) are served by uq_org_contact_email
+OLD_INDEXES = [
+    ('ix_contacts_organization_id', ['organization_id']),
+    ('ix_contacts_email', ['email']),
+    ('ix_contacts_subscription_status', ['subscription_status']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_org_status',
+            'contacts',
+            ['organization_id', 'subscription_status'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        for name, _ in OLD_INDEXES:
+            op.drop_index(name, table_name='contacts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in OLD_INDEXES:
+            op.create_index(
+                name,
+                'contacts',
+                columns,
+                unique=False,
+                postgresql_concurrently=True
+            )
+        op.drop_index('ix_contacts_org_status', table_name='contacts', postgresql_concurrently=True)
@@ -0,0 +1,76 @@
+"""Copy organization_id onto email_templates and campaign_recipients
+
+Revision ID: 5ec43ea08a0a
+Revises: 1fb2f4b21b82
+Create Date: 2026-10-15 19:52:40.117384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5ec43ea08a0a'
+down_revision: Union[str, Sequence[str], None] = '1fb2f4b21b82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Child tables of campaigns that get the campaign's organization_id
+TABLES = ['email_templates', 'campaign_recipients']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                'organization_id',
+                sa.UUID(),
+                nullable=True,
+                comment="Campaign's organization (denormalized for access checks)"
+            )
+        )
+        op.execute(f"""
+            UPDATE {table} t
+            SET organization_id = c.organization_id
+            FROM campaigns c
+            WHERE c.id = t.campaign_id
+        """)
+        op.alter_column(table, 'organization_id', existing_type=sa.UUID(), nullable=False)
+        op.create_foreign_key(
+            f'{table}_organization_id_fkey',
+            table,
+            'organizations',
+            ['organization_id'],
+            ['id'],
+            ondelete='CASCADE'
+        )
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                op.f(f'ix_{table}_organization_id'),
+                table,
+                ['organization_id'],
+                unique=False,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                op.f(f'ix_{table}_organization_id'),
+                table_name=table,
+                postgresql_concurrently=True
+            )
+    for table in TABLES:
+        op.drop_constraint(f'{table}_organization_id_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'organization_id')
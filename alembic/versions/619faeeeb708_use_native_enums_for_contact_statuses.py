@@ -0,0 +1,67 @@
+"""Use native enum types for contact subscription and recipient send status
+
+Revision ID: 619faeeeb708
+Revises: 8c1b6e8414e8
+Create Date: 2026-10-15 18:49:33.018452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '619faeeeb708'
+down_revision: Union[str, Sequence[str], None] = '8c1b6e8414e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type, comment)
+ENUM_COLUMNS = [
+    (
+        'contacts',
+        'subscription_status',
+        postgresql.ENUM('subscribed', 'unsubscribed', 'bounced', 'complained', name='subscription_status'),
+        'Subscription status',
+    ),
+    (
+        'campaign_recipients',
+        'send_status',
+        postgresql.ENUM('pending', 'sent', 'failed', 'bounced', name='send_status'),
+        'Send status: pending, sent, failed, bounced',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indexes on these columns are rebuilt by ALTER COLUMN TYPE
+    for table, column, enum_type, comment in ENUM_COLUMNS:
+        enum_type.create(op.get_bind())
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(length=50),
+            existing_nullable=False,
+            existing_comment=comment,
+            postgresql_using=f'{column}::{enum_type.name}'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, enum_type, comment in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=50),
+            existing_type=enum_type,
+            existing_nullable=False,
+            existing_comment=comment,
+            postgresql_using=f'{column}::text'
+        )
+        enum_type.drop(op.get_bind())
@@ -0,0 +1,57 @@
+"""Add campaigns.search_vector full-text column and GIN index
+
+Revision ID: 7e19192c6452
+Revises: 2b5e5c01bcf8
+Create Date: 2026-10-15 11:41:09.207633
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e19192c6452'
+down_revision: Union[str, Sequence[str], None] = '2b5e5c01bcf8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'campaigns',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+                persisted=True
+            ),
+            nullable=True,
+            comment='Full-text search document for name and description'
+        )
+    )
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_campaigns_search',
+            'campaigns',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_campaigns_search',
+            table_name='campaigns',
+            postgresql_concurrently=True
+        )
+    op.drop_column('campaigns', 'search_vector')
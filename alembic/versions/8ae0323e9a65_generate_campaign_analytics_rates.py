@@ -0,0 +1,72 @@
+"""Turn campaign_analytics rate columns into generated columns
+
+Revision ID: 8ae0323e9a65
+Revises: 7e19192c6452
+Create Date: 2026-10-15 14:26:51.830417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8ae0323e9a65'
+down_revision: Union[str, Sequence[str], None] = '7e19192c6452'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rate_expression(numerator: str, denominator: str) -> str:
+    return (
+        f"CASE WHEN {denominator} > 0 "
+        f"THEN round({numerator}::numeric / {denominator} * 100, 2) END"
+    )
+
+
+# (column, numerator, denominator, comment)
+RATE_COLUMNS = [
+    ('delivery_rate', 'total_delivered', 'total_sent', 'Delivery rate percentage'),
+    ('open_rate', 'unique_opens', 'total_delivered', 'Open rate percentage'),
+    ('click_rate', 'unique_clicks', 'total_delivered', 'Click rate percentage'),
+    ('click_to_open_rate', 'unique_clicks', 'unique_opens', 'Click-to-open rate percentage'),
+    ('unsubscribe_rate', 'total_unsubscribes', 'total_delivered', 'Unsubscribe rate percentage'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An existing column cannot be turned into a generated one, so re-create them
+    for name, numerator, denominator, comment in RATE_COLUMNS:
+        op.drop_column('campaign_analytics', name)
+        op.add_column(
+            'campaign_analytics',
+            sa.Column(
+                name,
+                sa.DECIMAL(precision=5, scale=2),
+                sa.Computed(_rate_expression(numerator, denominator), persisted=True),
+                nullable=True,
+                comment=comment
+            )
+        )
+    op.drop_column('campaign_analytics', 'last_calculated_at')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        'campaign_analytics',
+        sa.Column(
+            'last_calculated_at',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment='Last time analytics were calculated'
+        )
+    )
+    for name, _, _, comment in RATE_COLUMNS:
+        op.drop_column('campaign_analytics', name)
+        op.add_column(
+            'campaign_analytics',
+            sa.Column(name, sa.DECIMAL(precision=5, scale=2), nullable=True, comment=comment)
+        )
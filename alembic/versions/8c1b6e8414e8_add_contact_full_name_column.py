@@ -0,0 +1,62 @@
+"""Store contact full_name as a generated column with a trigram index
+
+Revision ID: 8c1b6e8414e8
+Revises: 3d7d5cc55144
+Create Date: 2026-10-15 18:24:06.775203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1b6e8414e8'
+down_revision: Union[str, Sequence[str], None] = '3d7d5cc55144'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same result as the former Contact.full_name property; only immutable
+# functions are allowed in a generated column (concat_ws is not)
+FULL_NAME_EXPRESSION = (
+    "COALESCE("
+    "NULLIF(first_name, '') || ' ' || NULLIF(last_name, ''), "
+    "NULLIF(first_name, ''), "
+    "NULLIF(last_name, ''), "
+    "email)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column(
+        'contacts',
+        sa.Column(
+            'full_name',
+            sa.String(length=255),
+            sa.Computed(FULL_NAME_EXPRESSION, persisted=True),
+            nullable=False,
+            comment='First and last name, falling back to email'
+        )
+    )
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_full_name_trgm',
+            'contacts',
+            ['full_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_full_name_trgm', table_name='contacts', postgresql_concurrently=True)
+    op.drop_column('contacts', 'full_name')
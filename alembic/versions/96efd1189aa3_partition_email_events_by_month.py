@@ -0,0 +1,129 @@
+"""Partition email_events by month on occurred_at
+
+Revision ID: 96efd1189aa3
+Revises: d1fbb634ff5e
+Create Date: 2026-10-15 15:18:40.127465
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96efd1189aa3'
+down_revision: Union[str, Sequence[str], None] = 'd1fbb634ff5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Months of partitions created ahead of the current one
+PARTITION_MONTHS_AHEAD = 3
+
+# Creates the partition holding the (UTC) calendar month that contains month_start
+CREATE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_email_events_partition(month_start date)
+RETURNS void AS $$
+DECLARE
+    start_month date := date_trunc('month', month_start)::date;
+    end_month date := (date_trunc('month', month_start) + interval '1 month')::date;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF email_events FOR VALUES FROM (%L) TO (%L)',
+        'email_events_' || to_char(start_month, 'YYYY_MM'),
+        start_month::timestamp AT TIME ZONE 'UTC',
+        end_month::timestamp AT TIME ZONE 'UTC'
+    );
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _email_events_columns() -> list:
+    return [
+        sa.Column('campaign_recipient_id', sa.UUID(), nullable=False, comment='Reference to campaign recipient'),
+        sa.Column('event_type', sa.String(length=50), nullable=False, comment='Event type: sent, delivered, opened, clicked, bounced, unsubscribed, complained'),
+        sa.Column('event_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Event-specific data: link_url, bounce_type, user_agent, etc.'),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), server_default='now()', nullable=False, comment='When event occurred'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default='now()', nullable=False, comment='When event was recorded'),
+        sa.Column('id', sa.UUID(), nullable=False, comment='Unique identifier'),
+        sa.ForeignKeyConstraint(['campaign_recipient_id'], ['campaign_recipients.id'], ondelete='CASCADE'),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index('idx_email_events_lookup', 'email_events', ['campaign_recipient_id', 'event_type', 'occurred_at'], unique=False)
+    op.create_index('idx_email_events_occurred_brin', 'email_events', ['occurred_at'], unique=False, postgresql_using='brin')
+    op.create_index('idx_email_events_bounce', 'email_events', ['campaign_recipient_id'], unique=False, postgresql_where=sa.text("event_type = 'bounced'"))
+
+
+def _drop_indexes() -> None:
+    op.drop_index('idx_email_events_bounce', table_name='email_events')
+    op.drop_index('idx_email_events_occurred_brin', table_name='email_events')
+    op.drop_index('idx_email_events_lookup', table_name='email_events')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Move the existing table aside, freeing its index/constraint names
+    _drop_indexes()
+    op.rename_table('email_events', 'email_events_old')
+    op.execute('ALTER TABLE email_events_old RENAME CONSTRAINT email_events_pkey TO email_events_old_pkey')
+
+    # The partition key has to be part of the primary key
+    op.create_table(
+        'email_events',
+        *_email_events_columns(),
+        sa.PrimaryKeyConstraint('occurred_at', 'id'),
+        postgresql_partition_by='RANGE (occurred_at)'
+    )
+    op.execute(CREATE_PARTITION_FUNCTION)
+    # Catch-all so inserts never fail when a monthly partition is missing
+    op.execute('CREATE TABLE email_events_default PARTITION OF email_events DEFAULT')
+
+    # Partitions from the oldest existing event up to a few months ahead
+    op.execute(f"""
+        SELECT ensure_email_events_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', LEAST(
+                (SELECT min(occurred_at) FROM email_events_old),
+                now()
+            ) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PARTITION_MONTHS_AHEAD} months',
+            interval '1 month'
+        ) AS month
+    """)
+
+    op.execute("""
+        INSERT INTO email_events (campaign_recipient_id, event_type, event_data, occurred_at, created_at, id)
+        SELECT campaign_recipient_id, event_type, event_data, occurred_at, created_at, id
+        FROM email_events_old
+    """)
+    op.drop_table('email_events_old')
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_indexes()
+    op.rename_table('email_events', 'email_events_partitioned')
+    op.execute('ALTER TABLE email_events_partitioned RENAME CONSTRAINT email_events_pkey TO email_events_partitioned_pkey')
+
+    op.create_table(
+        'email_events',
+        *_email_events_columns(),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("""
+        INSERT INTO email_events (campaign_recipient_id, event_type, event_data, occurred_at, created_at, id)
+        SELECT campaign_recipient_id, event_type, event_data, occurred_at, created_at, id
+        FROM email_events_partitioned
+    """)
+    # Dropping the parent drops every partition with it
+    op.drop_table('email_events_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS ensure_email_events_partition(date)')
+
+    _create_indexes()
@@ -0,0 +1,86 @@
+"""Add server defaults matching the model-side constant and UUID defaults
+
+Revision ID: a1bd3c2007c6
+Revises: 5ec43ea08a0a
+Create Date: 2026-10-15 20:14:27.558031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1bd3c2007c6'
+down_revision: Union[str, Sequence[str], None] = '5ec43ea08a0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose UUID primary key (UUIDMixin) gets gen_random_uuid()
+UUID_TABLES = [
+    'organizations',
+    'company_profiles',
+    'contacts',
+    'users',
+    'campaigns',
+    'contact_lists',
+    'campaign_analytics',
+    'campaign_objectives',
+    'campaign_recipients',
+    'contact_list_members',
+    'email_templates',
+    'ai_generation_jobs',
+    'email_revisions',
+]
+
+# (table, column, default SQL)
+COLUMN_DEFAULTS = [
+    ('organizations', 'is_active', 'true'),
+    ('organizations', 'subscription_tier', "'beta'"),
+    ('contacts', 'subscription_status', "'subscribed'"),
+    ('contacts', 'email_verified', 'false'),
+    ('users', 'role', "'member'"),
+    ('users', 'is_active', 'true'),
+    ('campaigns', 'status', "'draft'"),
+    ('campaigns', 'generation_iterations', '0'),
+    ('contact_lists', 'total_contacts', '0'),
+    ('campaign_analytics', 'total_sent', '0'),
+    ('campaign_analytics', 'total_delivered', '0'),
+    ('campaign_analytics', 'total_bounced', '0'),
+    ('campaign_analytics', 'total_failed', '0'),
+    ('campaign_analytics', 'total_opens', '0'),
+    ('campaign_analytics', 'unique_opens', '0'),
+    ('campaign_analytics', 'total_clicks', '0'),
+    ('campaign_analytics', 'unique_clicks', '0'),
+    ('campaign_analytics', 'total_unsubscribes', '0'),
+    ('campaign_analytics', 'total_spam_reports', '0'),
+    ('campaign_analytics', 'goal_achieved', 'false'),
+    ('campaign_objectives', 'priority', '1'),
+    ('campaign_recipients', 'send_status', "'pending'"),
+    ('campaign_recipients', 'unsubscribed', 'false'),
+    ('email_templates', 'is_current', 'false'),
+    ('email_templates', 'generated_by', "'ai'"),
+    ('email_templates', 'status', "'draft'"),
+    ('ai_generation_jobs', 'status', "'pending'"),
+    ('campaign_recipient_stats', 'open_count', '0'),
+    ('campaign_recipient_stats', 'click_count', '0'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Catalog-only changes; existing rows are not rewritten
+    for table in UUID_TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    for table, column, default in COLUMN_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, _ in reversed(COLUMN_DEFAULTS):
+        op.alter_column(table, column, server_default=None)
+    for table in reversed(UUID_TABLES):
+        op.alter_column(table, 'id', server_default=None)
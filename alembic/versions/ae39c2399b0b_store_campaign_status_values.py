@@ -0,0 +1,29 @@
+"""Store campaign status as its plain string value
+
+Revision ID: ae39c2399b0b
+Revises: 96efd1189aa3
+Create Date: 2026-10-15 16:02:11.408377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae39c2399b0b'
+down_revision: Union[str, Sequence[str], None] = '96efd1189aa3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The non-native Enum stored member names ('DRAFT'); the String column
+    # stores values ('draft'). The column type itself stays VARCHAR(50).
+    op.execute('UPDATE campaigns SET status = lower(status)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('UPDATE campaigns SET status = upper(status)')
@@ -0,0 +1,72 @@
+"""Replace email_events single-column indexes with composite/BRIN/partial ones
+
+Revision ID: d1fbb634ff5e
+Revises: 8ae0323e9a65
+Create Date: 2026-10-15 14:52:03.661958
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1fbb634ff5e'
+down_revision: Union[str, Sequence[str], None] = '8ae0323e9a65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns) of the original single-column indexes
+OLD_INDEXES = [
+    ('idx_email_events_occurred', ['occurred_at']),
+    ('idx_email_events_recipient', ['campaign_recipient_id']),
+    ('idx_email_events_type', ['event_type']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_email_events_lookup',
+            'email_events',
+            ['campaign_recipient_id', 'event_type', 'occurred_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_email_events_occurred_brin',
+            'email_events',
+            ['occurred_at'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_email_events_bounce',
+            'email_events',
+            ['campaign_recipient_id'],
+            unique=False,
+            postgresql_where=sa.text("event_type = 'bounced'"),
+            postgresql_concurrently=True
+        )
+        for name, _ in OLD_INDEXES:
+            op.drop_index(name, table_name='email_events', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in OLD_INDEXES:
+            op.create_index(
+                name,
+                'email_events',
+                columns,
+                unique=False,
+                postgresql_concurrently=True
+            )
+        for name in ('idx_email_events_bounce', 'idx_email_events_occurred_brin', 'idx_email_events_lookup'):
+            op.drop_index(name, table_name='email_events', postgresql_concurrently=True)
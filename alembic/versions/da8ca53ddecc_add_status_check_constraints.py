@@ -0,0 +1,62 @@
+"""Add CHECK constraints limiting campaign, template and job status columns to known values
+
+Revision ID: da8ca53ddecc
+Revises: 53ca01dba932
+Create Date: 2026-10-15 20:48:51.336904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da8ca53ddecc'
+down_revision: Union[str, Sequence[str], None] = '53ca01dba932'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (constraint, table, column, allowed values); must match the model enums
+STATUS_CHECKS = [
+    (
+        'ck_campaigns_status',
+        'campaigns',
+        'status',
+        ['draft', 'generating', 'review', 'scheduled', 'sending', 'sent', 'paused', 'archived'],
+    ),
+    (
+        'ck_email_templates_status',
+        'email_templates',
+        'status',
+        ['draft', 'review', 'approved', 'rejected', 'archived'],
+    ),
+    (
+        'ck_email_templates_generated_by',
+        'email_templates',
+        'generated_by',
+        ['ai', 'human', 'hybrid'],
+    ),
+    (
+        'ck_ai_generation_jobs_status',
+        'ai_generation_jobs',
+        'status',
+        ['pending', 'processing', 'completed', 'failed', 'cancelled'],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOT VALID adds the constraint without a table scan under the exclusive
+    # lock; VALIDATE then checks existing rows holding only a weaker lock
+    for name, table, column, values in STATUS_CHECKS:
+        allowed = ', '.join(f"'{value}'" for value in values)
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({column} IN ({allowed})) NOT VALID')
+        op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(STATUS_CHECKS):
+        op.drop_constraint(name, table, type_='check')
@@ -0,0 +1,41 @@
+"""Compress large template and generation payload columns with lz4
+
+Revision ID: dea1f42152ae
+Revises: 619faeeeb708
+Create Date: 2026-10-15 19:09:36.271845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dea1f42152ae'
+down_revision: Union[str, Sequence[str], None] = '619faeeeb708'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs holding HTML bodies or generated variants
+CONTENT_COLUMNS = [
+    ('email_templates', 'html_content'),
+    ('email_templates', 'plain_text_content'),
+    ('ai_generation_jobs', 'context'),
+    ('ai_generation_jobs', 'generated_content'),
+    ('campaign_recipients', 'personalized_content'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Requires PostgreSQL 14+. Storage stays EXTENDED (EXTERNAL would disable
+    # compression); only values written from now on use lz4.
+    for table, column in CONTENT_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in CONTENT_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default')
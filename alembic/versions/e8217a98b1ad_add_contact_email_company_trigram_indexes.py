@@ -0,0 +1,45 @@
+"""Add trigram indexes on contact email and company
+
+Revision ID: e8217a98b1ad
+Revises: dea1f42152ae
+Create Date: 2026-10-15 19:21:48.630517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8217a98b1ad'
+down_revision: Union[str, Sequence[str], None] = 'dea1f42152ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns searched with ILIKE '%...%'; the email btree stays for exact lookups
+TRIGRAM_COLUMNS = ['email', 'company']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for column in TRIGRAM_COLUMNS:
+            op.create_index(
+                f'ix_contacts_{column}_trgm',
+                'contacts',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in reversed(TRIGRAM_COLUMNS):
+            op.drop_index(f'ix_contacts_{column}_trgm', table_name='contacts', postgresql_concurrently=True)
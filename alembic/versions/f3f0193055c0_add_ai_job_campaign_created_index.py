@@ -0,0 +1,55 @@
+"""Add ai_generation_jobs (campaign_id, created_at DESC) listing index
+
+Revision ID: f3f0193055c0
+Revises: 95d0f8a235fe
+Create Date: 2026-10-15 09:12:44.381027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3f0193055c0'
+down_revision: Union[str, Sequence[str], None] = '95d0f8a235fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_aijob_campaign_created',
+            'ai_generation_jobs',
+            ['campaign_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_include=['status', 'job_type'],
+            postgresql_concurrently=True
+        )
+        # Covered by the leading column of the new index
+        op.drop_index(
+            op.f('ix_ai_generation_jobs_campaign_id'),
+            table_name='ai_generation_jobs',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_ai_generation_jobs_campaign_id'),
+            'ai_generation_jobs',
+            ['campaign_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_aijob_campaign_created',
+            table_name='ai_generation_jobs',
+            postgresql_concurrently=True
+        )
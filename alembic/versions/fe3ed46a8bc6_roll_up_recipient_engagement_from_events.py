@@ -0,0 +1,118 @@
+"""Move recipient open/click counters into a rollup table fed by email_events
+
+Revision ID: fe3ed46a8bc6
+Revises: 08ff32060112
+Create Date: 2026-10-15 17:31:14.550219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fe3ed46a8bc6'
+down_revision: Union[str, Sequence[str], None] = '08ff32060112'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rollup name in rollup_watermarks (workers.maintenance_tasks.RECIPIENT_STATS_ROLLUP)
+RECIPIENT_STATS_ROLLUP = 'campaign_recipient_stats'
+
+# Counter columns moving from campaign_recipients to campaign_recipient_stats
+STATS_COLUMNS = [
+    'open_count', 'first_opened_at', 'last_opened_at',
+    'click_count', 'first_clicked_at', 'last_clicked_at',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'campaign_recipient_stats',
+        sa.Column('campaign_recipient_id', sa.UUID(), nullable=False, comment='Reference to campaign recipient'),
+        sa.Column('campaign_id', sa.UUID(), nullable=False, comment="Recipient's campaign (denormalized for per-campaign aggregates)"),
+        sa.Column('open_count', sa.Integer(), nullable=False, comment='Number of times opened'),
+        sa.Column('first_opened_at', sa.DateTime(timezone=True), nullable=True, comment='First open timestamp'),
+        sa.Column('last_opened_at', sa.DateTime(timezone=True), nullable=True, comment='Last open timestamp'),
+        sa.Column('click_count', sa.Integer(), nullable=False, comment='Number of clicks'),
+        sa.Column('first_clicked_at', sa.DateTime(timezone=True), nullable=True, comment='First click timestamp'),
+        sa.Column('last_clicked_at', sa.DateTime(timezone=True), nullable=True, comment='Last click timestamp'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='When the rollup last changed'),
+        sa.ForeignKeyConstraint(['campaign_recipient_id'], ['campaign_recipients.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('campaign_recipient_id')
+    )
+    op.create_index(
+        'ix_recipient_stats_campaign',
+        'campaign_recipient_stats',
+        ['campaign_id'],
+        unique=False,
+        postgresql_include=['open_count', 'click_count']
+    )
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(length=100), nullable=False, comment='Rollup name'),
+        sa.Column('processed_until', sa.DateTime(timezone=True), nullable=False, comment='Events recorded before this time have been rolled up'),
+        sa.PrimaryKeyConstraint('name')
+    )
+    # The rollup scans email_events by recording time
+    op.create_index(
+        'idx_email_events_created_brin',
+        'email_events',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin'
+    )
+
+    # Carry over existing counters; events recorded from now on are rolled up
+    columns = ', '.join(STATS_COLUMNS)
+    op.execute(f"""
+        INSERT INTO campaign_recipient_stats (campaign_recipient_id, campaign_id, {columns})
+        SELECT id, campaign_id, {columns}
+        FROM campaign_recipients
+        WHERE open_count > 0 OR click_count > 0
+    """)
+    op.execute(f"""
+        INSERT INTO rollup_watermarks (name, processed_until)
+        VALUES ('{RECIPIENT_STATS_ROLLUP}', now())
+    """)
+
+    op.drop_index('ix_recipients_campaign_clicked', table_name='campaign_recipients')
+    op.drop_index('ix_recipients_campaign_opened', table_name='campaign_recipients')
+    for name in ['opened', 'clicked', *STATS_COLUMNS]:
+        op.drop_column('campaign_recipients', name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('campaign_recipients', sa.Column('opened', sa.Boolean(), server_default=sa.false(), nullable=False, comment='Whether email was opened'))
+    op.add_column('campaign_recipients', sa.Column('open_count', sa.Integer(), server_default='0', nullable=False, comment='Number of times opened'))
+    op.add_column('campaign_recipients', sa.Column('first_opened_at', sa.DateTime(timezone=True), nullable=True, comment='First open timestamp'))
+    op.add_column('campaign_recipients', sa.Column('last_opened_at', sa.DateTime(timezone=True), nullable=True, comment='Last open timestamp'))
+    op.add_column('campaign_recipients', sa.Column('clicked', sa.Boolean(), server_default=sa.false(), nullable=False, comment='Whether any link was clicked'))
+    op.add_column('campaign_recipients', sa.Column('click_count', sa.Integer(), server_default='0', nullable=False, comment='Number of clicks'))
+    op.add_column('campaign_recipients', sa.Column('first_clicked_at', sa.DateTime(timezone=True), nullable=True, comment='First click timestamp'))
+    op.add_column('campaign_recipients', sa.Column('last_clicked_at', sa.DateTime(timezone=True), nullable=True, comment='Last click timestamp'))
+    for name in ['opened', 'open_count', 'clicked', 'click_count']:
+        op.alter_column('campaign_recipients', name, server_default=None)
+
+    assignments = ', '.join(f'{name} = s.{name}' for name in STATS_COLUMNS)
+    op.execute(f"""
+        UPDATE campaign_recipients r
+        SET {assignments},
+            opened = s.open_count > 0,
+            clicked = s.click_count > 0
+        FROM campaign_recipient_stats s
+        WHERE s.campaign_recipient_id = r.id
+    """)
+
+    op.create_index('ix_recipients_campaign_opened', 'campaign_recipients', ['campaign_id', 'opened'], unique=False, postgresql_include=['open_count'])
+    op.create_index('ix_recipients_campaign_clicked', 'campaign_recipients', ['campaign_id', 'clicked'], unique=False, postgresql_include=['click_count'])
+
+    op.drop_index('idx_email_events_created_brin', table_name='email_events')
+    op.drop_table('rollup_watermarks')
+    op.drop_index('ix_recipient_stats_campaign', table_name='campaign_recipient_stats')
+    op.drop_table('campaign_recipient_stats')
@@ -11,6 +11,7 @@ from core.database import get_db
 from core.security import decode_token
 from models.user import User
 from services.auth_service import AuthService
+from services.campaign_service import CampaignService
 
 # Security scheme
 security = HTTPBearer()
@@ -164,8 +165,10 @@ def check_user_role(required_roles: list[str]):
     Returns:
         Dependency function
     """
+    allowed_roles = frozenset(required_roles)
+    
     async def role_checker(current_user: User = Depends(get_current_active_user)):
-        if current_user.role not in required_roles:
+        if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Required role: {', '.join(required_roles)}"
@@ -178,4 +181,24 @@ def check_user_role(required_roles: list[str]):
 # Common role dependencies
 require_owner = check_user_role(["owner"])
 require_admin = check_user_role(["owner", "admin"])
-require_member = check_user_role(["owner", "admin", "member"])
\ No newline at end of file
+require_member = check_user_role(["owner", "admin", "member"])
+
+
+# ============================================
+# SERVICE DEPENDENCIES
+# ============================================
+
+def get_campaign_service(db: AsyncSession = Depends(get_db)) -> CampaignService:
+    """
+    Campaign service bound to the request's database session
+    
+    Resolved once per request by FastAPI's dependency cache, so every
+    dependency that asks for it shares the same instance and session.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Campaign service
+    """
+    return CampaignService(db)
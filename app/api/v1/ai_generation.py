@@ -1,13 +1,20 @@
 """
 AI Generation endpoints for email content creation
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, AsyncIterator
+from datetime import datetime
+import asyncio
+import json
+import time
 import uuid
-import math
 
-from core.database import get_db
+from core.database import get_db, AsyncSessionLocal
+from core.cache import redis_client, job_events_channel, cache_get, cache_set, cache_delete
 from schemas.ai_generation import (
     AIGenerationRequest,
     AIGenerationResponse,
@@ -16,23 +23,118 @@ from schemas.ai_generation import (
     SubjectLineVariantsResponse,
     AIGenerationJobList,
     AIJobStatus,
+    AIJobType,
 )
 from schemas.auth import MessageResponse
-from schemas.campaign import CampaignResponse
-from services.ai_generation_service import AIGenerationService
+from schemas.campaign import CampaignResponse, CampaignStatusEnum
+from services.ai_generation_service import (
+    AIGenerationService,
+    generation_idempotency_key,
+    GENERATION_IDEMPOTENCY_TTL,
+)
 from services.campaign_service import CampaignService
 from api.deps import get_current_active_user, require_member
 from models.user import User
+from models.template import AIGenerationJob
+from utils.http import etag_matches
 
-# Import Celery tasks
-from workers.ai_generation_tasks import (
-    process_email_generation,
-    process_email_refinement,
-    process_subject_line_generation,
-)
+# Celery task dispatch
+from workers.dispatch import dispatch_job
 
 router = APIRouter(tags=["AI Generation"])
 
+# Job statuses after which no further updates are published
+TERMINAL_JOB_STATUSES = {
+    AIJobStatus.COMPLETED.value,
+    AIJobStatus.FAILED.value,
+    AIJobStatus.CANCELLED.value,
+}
+
+# Streams end after the Celery hard time limit; heartbeats keep proxies from idling out
+JOB_STREAM_TIMEOUT_SECONDS = 300
+JOB_STREAM_HEARTBEAT_SECONDS = 15
+
+
+def _job_to_dict(job: AIGenerationJob) -> dict:
+    """
+    Serialize a job row to the AIGenerationResponse shape without building a model
+    
+    Args:
+        job: AI generation job loaded from the database
+        
+    Returns:
+        Dict ready for ORJSONResponse (UUIDs and datetimes are encoded by orjson)
+    """
+    return {
+        "id": job.id,
+        "campaign_id": job.campaign_id,
+        "status": job.status,
+        "job_type": job.job_type,
+        "generated_content": job.generated_content,
+        "ai_model": job.ai_model,
+        "tokens_used": job.tokens_used,
+        "estimated_completion_seconds": None,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: set = set()
+
+
+async def _mark_campaign_generating(campaign_id: uuid.UUID, organization_id: uuid.UUID) -> None:
+    """
+    Best-effort switch of a campaign to GENERATING after the job was accepted
+    
+    Runs on its own short-lived session because the request session is closed
+    by the time this executes.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await CampaignService(session).change_campaign_status(
+                campaign_id=campaign_id,
+                organization_id=organization_id,
+                new_status=CampaignStatusEnum.GENERATING
+            )
+    except Exception as e:
+        print(f"Failed to mark campaign {campaign_id} as generating: {e}")
+
+
+async def _enqueue_job(ai_service: AIGenerationService, job: AIGenerationJob) -> None:
+    """
+    Hand a committed job to the workers, failing the job if the publish fails
+    
+    Otherwise the job would stay pending forever, since no worker receives it.
+    The Celery publish is blocking broker I/O, so it runs in the threadpool.
+    
+    Args:
+        ai_service: Service bound to the request session
+        job: Committed generation job
+        
+    Raises:
+        HTTPException: If the job could not be enqueued
+    """
+    try:
+        await run_in_threadpool(dispatch_job, job.job_type, job.id)
+    except Exception as e:
+        print(f"Failed to enqueue job {job.id}: {e}")
+        try:
+            await ai_service.mark_job_failed(job.id, f"Failed to enqueue job: {e}")
+        except Exception as mark_error:
+            print(f"Failed to mark job {job.id} as failed: {mark_error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to enqueue generation job"
+        )
+
+
+def _job_etag(job: AIGenerationJob) -> str:
+    """Weak ETag that changes whenever the job row is updated"""
+    return f'W/"{job.id}:{int(job.updated_at.timestamp() * 1_000_000)}:{job.status}"'
+
 
 # ============================================
 # EMAIL CONTENT GENERATION
@@ -46,9 +148,9 @@ router = APIRouter(tags=["AI Generation"])
     description="Generate email content using AI for a campaign (async operation)"
 )
 async def generate_email_content(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     generation_request: AIGenerationRequest,
-    background_tasks: BackgroundTasks,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
 ):
@@ -63,6 +165,10 @@ async def generate_email_content(
     This is an **async operation** that returns immediately with a job_id.
     Poll the GET endpoint to check status and retrieve results.
     
+    Identical requests (same prompt and options, or the same `Idempotency-Key`
+    header) within 60 seconds return the already-created job instead of
+    starting another generation.
+    
     **Generation Options:**
     - **tone**: professional, friendly, formal, casual, urgent, enthusiastic
     - **length**: short (~100-150 words), medium (~200-300), long (~400-500)
@@ -74,47 +180,74 @@ async def generate_email_content(
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
+    # Collapse duplicate submissions (retries, double clicks) onto a single job
+    dedup_key = generation_idempotency_key(campaign_id, generation_request, idempotency_key)
+    job_id = uuid.uuid4()
+    claimed = await cache_set(dedup_key, str(job_id), GENERATION_IDEMPOTENCY_TTL, nx=True)
+    
+    if claimed is False:
+        existing_job = None
+        existing_id = await cache_get(dedup_key)
+        if existing_id:
+            existing_job = await ai_service.get_generation_job(
+                job_id=uuid.UUID(existing_id),
+                campaign_id=campaign_id,
+                organization_id=current_user.organization_id
+            )
+        
+        if not existing_job:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="An identical generation request is already being processed"
+            )
+        
+        return AIGenerationResponse(
+            id=existing_job.id,
+            campaign_id=campaign_id,
+            status=existing_job.status,
+            job_type=existing_job.job_type,
+            estimated_completion_seconds=30,
+            created_at=existing_job.created_at
         )
     
+    committed = False
     try:
         # Create generation job
         job = await ai_service.create_generation_job(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             user_id=current_user.id,
-            generation_request=generation_request
+            generation_request=generation_request,
+            job_id=job_id
         )
         
-        # Trigger background processing
-        background_tasks.add_task(
-            process_email_generation.delay,
-            str(job.id)
-        )
+        await db.commit()
+        committed = True
         
-        # Update campaign status to generating
-        campaign_service = CampaignService(db)
-        from schemas.campaign import CampaignStatusEnum
-        await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
-            organization_id=current_user.organization_id,
-            new_status=CampaignStatusEnum.GENERATING
+        # Return the connection to the pool before talking to the broker
+        await db.close()
+        
+        # Enqueue processing (job is committed)
+        await _enqueue_job(ai_service, job)
+        
+        # The response only needs the job; update campaign status off the request path
+        status_task = asyncio.create_task(
+            _mark_campaign_generating(campaign_id, current_user.organization_id)
         )
+        _background_tasks.add(status_task)
+        status_task.add_done_callback(_background_tasks.discard)
         
         return AIGenerationResponse(
             id=job.id,
             campaign_id=campaign_id,
-            status=AIJobStatus(job.status),
+            status=job.status,
             job_type=job.job_type,
             estimated_completion_seconds=30,
             created_at=job.created_at
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,6 +258,13 @@ async def generate_email_content(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create generation job: {str(e)}"
         )
+    finally:
+        # Release the claim if the job was never committed (including on
+        # cancellation) so retries are not answered with 409. Once committed,
+        # the claim keeps pointing at the job, so a retry gets that job back
+        # (failed, if it could not be enqueued) instead of a duplicate.
+        if not committed:
+            await cache_delete(dedup_key)
 
 
 @router.get(
@@ -134,8 +274,9 @@ async def generate_email_content(
     description="Get the status and results of an AI generation job"
 )
 async def get_generation_job_status(
-    campaign_id: str,
-    job_id: str,
+    campaign_id: uuid.UUID,
+    job_id: uuid.UUID,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -155,42 +296,125 @@ async def get_generation_job_status(
     When status is 'completed', the `generated_content` field will contain:
     - **variants**: Array of generated email variants
     - Each variant includes: subject_line, preview_text, html_content, plain_text_content, confidence_score, reasoning
+    
+    Responses carry an `ETag`; pollers should send it back as `If-None-Match`
+    and will get an empty `304 Not Modified` until the job changes.
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        job_uuid = uuid.UUID(job_id)
-    except ValueError:
+    job = await ai_service.get_generation_job(
+        job_id=job_id,
+        campaign_id=campaign_id,
+        organization_id=current_user.organization_id
+    )
+    
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Generation job not found"
         )
     
-    job = await ai_service.get_generation_job(
-        job_id=job_uuid,
-        campaign_id=campaign_uuid,
-        organization_id=current_user.organization_id
+    etag = _job_etag(job)
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "no-cache"}
+        )
+    
+    return ORJSONResponse(
+        _job_to_dict(job),
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
     )
+
+
+@router.get(
+    "/campaigns/{campaign_id}/generate/{job_id}/stream",
+    summary="Stream generation job status",
+    description="Server-sent events stream that fires when a generation job finishes"
+)
+async def stream_generation_job_status(
+    campaign_id: uuid.UUID,
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream generation job status updates (Server-Sent Events):
+    
+    - **campaign_id**: Campaign UUID
+    - **job_id**: Generation job UUID
+    
+    Emits a `status` event with `{"job_id", "status"}` as soon as the job reaches
+    completed, failed or cancelled, then closes the stream. Fetch the full result
+    from the GET endpoint afterwards. The GET endpoint remains available for polling.
+    """
+    pubsub = redis_client.pubsub()
+    
+    # Subscribe before reading the job so a completion in between is not missed
+    try:
+        await pubsub.subscribe(job_events_channel(job_id))
+    except RedisError:
+        await pubsub.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Status streaming unavailable, poll the job endpoint instead"
+        )
+    
+    ai_service = AIGenerationService(db)
+    
+    try:
+        job = await ai_service.get_generation_job(
+            job_id=job_id,
+            campaign_id=campaign_id,
+            organization_id=current_user.organization_id
+        )
+    except Exception:
+        await pubsub.aclose()
+        raise
     
     if not job:
+        await pubsub.aclose()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Generation job not found"
         )
     
-    return AIGenerationResponse(
-        id=job.id,
-        campaign_id=campaign_id,
-        status=AIJobStatus(job.status),
-        job_type=job.job_type,
-        generated_content=job.generated_content,
-        ai_model=job.ai_model,
-        tokens_used=job.tokens_used,
-        error_message=job.error_message,
-        created_at=job.created_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at
+    initial_status = job.status
+    
+    # Nothing else needs the database; don't hold a pooled connection for the stream
+    await db.close()
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            yield f"event: status\ndata: {json.dumps({'job_id': str(job_id), 'status': initial_status})}\n\n"
+            if initial_status in TERMINAL_JOB_STATUSES:
+                return
+            
+            deadline = time.monotonic() + JOB_STREAM_TIMEOUT_SECONDS
+            while time.monotonic() < deadline:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=JOB_STREAM_HEARTBEAT_SECONDS
+                )
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                data = message["data"]
+                yield f"event: status\ndata: {data}\n\n"
+                if json.loads(data).get("status") in TERMINAL_JOB_STATUSES:
+                    return
+            
+            yield "event: timeout\ndata: {}\n\n"
+        except RedisError:
+            return
+        finally:
+            await pubsub.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
@@ -201,9 +425,12 @@ async def get_generation_job_status(
     description="List all generation jobs for a campaign"
 )
 async def list_generation_jobs(
-    campaign_id: str,
-    page: int = Query(1, ge=1),
+    campaign_id: uuid.UUID,
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    job_type: Optional[AIJobType] = Query(None, description="Filter by job type"),
+    status_filter: Optional[AIJobStatus] = Query(None, alias="status", description="Filter by job status"),
+    created_after: Optional[datetime] = Query(None, description="Only jobs created after this time"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -211,37 +438,40 @@ async def list_generation_jobs(
     List generation jobs for a campaign:
     
     - **campaign_id**: Campaign UUID
-    - **page**: Page number
     - **per_page**: Items per page
+    - **cursor**: Opaque cursor from the previous page (omit for the first page)
+    - **job_type**: Optional job type filter
+    - **status**: Optional job status filter
+    - **created_after**: Optional lower bound on creation time
     
-    Returns paginated list of all generation jobs (initial, refinement, subject line tests, etc.)
+    Returns a cursor-paginated list of all generation jobs (initial, refinement, subject line tests, etc.),
+    newest first. Pass `next_cursor` back as `cursor` while `has_more` is true.
     """
     ai_service = AIGenerationService(db)
     
     try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
+        jobs, next_cursor = await ai_service.list_generation_jobs(
+            campaign_id=campaign_id,
+            organization_id=current_user.organization_id,
+            per_page=per_page,
+            cursor=cursor,
+            job_type=job_type,
+            status=status_filter,
+            created_after=created_after
+        )
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
+            detail=str(e)
         )
     
-    jobs, total = await ai_service.list_generation_jobs(
-        campaign_id=campaign_uuid,
-        organization_id=current_user.organization_id,
-        page=page,
-        per_page=per_page
-    )
-    
-    pages = math.ceil(total / per_page) if total > 0 else 1
-    
-    return AIGenerationJobList(
-        jobs=[AIGenerationResponse.model_validate(job) for job in jobs],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=pages
-    )
+    # Rows come straight from the database, so skip per-row model validation
+    return ORJSONResponse({
+        "jobs": [_job_to_dict(job) for job in jobs],
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    })
 
 
 @router.post(
@@ -251,8 +481,8 @@ async def list_generation_jobs(
     description="Cancel a pending or processing generation job"
 )
 async def cancel_generation_job(
-    campaign_id: str,
-    job_id: str,
+    campaign_id: uuid.UUID,
+    job_id: uuid.UUID,
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
 ):
@@ -267,19 +497,10 @@ async def cancel_generation_job(
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        job_uuid = uuid.UUID(job_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
-        )
-    
     try:
         job = await ai_service.cancel_job(
-            job_id=job_uuid,
-            campaign_id=campaign_uuid,
+            job_id=job_id,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id
         )
         
@@ -289,7 +510,7 @@ async def cancel_generation_job(
                 detail="Generation job not found"
             )
         
-        return AIGenerationResponse.model_validate(job)
+        return ORJSONResponse(_job_to_dict(job))
         
     except ValueError as e:
         raise HTTPException(
@@ -310,8 +531,8 @@ async def cancel_generation_job(
     description="Create an email template from a generated variant"
 )
 async def create_template_from_variant(
-    campaign_id: str,
-    job_id: str,
+    campaign_id: uuid.UUID,
+    job_id: uuid.UUID,
     variant_id: int = Query(..., ge=1, description="Variant ID to use"),
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
@@ -330,20 +551,11 @@ async def create_template_from_variant(
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        job_uuid = uuid.UUID(job_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
-        )
-    
     try:
         template = await ai_service.create_template_from_variant(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
-            job_id=job_uuid,
+            job_id=job_id,
             variant_id=variant_id,
             created_by=current_user.id
         )
@@ -371,10 +583,9 @@ async def create_template_from_variant(
     description="Refine existing email content with AI (async operation)"
 )
 async def refine_email_content(
-    campaign_id: str,
-    template_id: str,
+    campaign_id: uuid.UUID,
+    template_id: uuid.UUID,
     refinement_request: AIRefinementRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
 ):
@@ -398,37 +609,28 @@ async def refine_email_content(
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        template_uuid = uuid.UUID(template_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
-        )
-    
     # Update refinement request with template_id
-    refinement_request.template_id = template_id
+    refinement_request.template_id = str(template_id)
     
     try:
         job = await ai_service.refine_template(
-            template_id=template_uuid,
-            campaign_id=campaign_uuid,
+            template_id=template_id,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             user_id=current_user.id,
             refinement_request=refinement_request
         )
         
-        # Trigger background processing
-        background_tasks.add_task(
-            process_email_refinement.delay,
-            str(job.id)
-        )
+        # Return the connection to the pool before talking to the broker
+        await db.close()
+        
+        # Enqueue processing (job is committed)
+        await _enqueue_job(ai_service, job)
         
         return AIGenerationResponse(
             id=job.id,
             campaign_id=campaign_id,
-            status=AIJobStatus(job.status),
+            status=job.status,
             job_type=job.job_type,
             estimated_completion_seconds=25,
             created_at=job.created_at
@@ -453,9 +655,8 @@ async def refine_email_content(
     description="Generate multiple subject line variants for A/B testing"
 )
 async def generate_subject_line_variants(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     request_data: SubjectLineVariantsRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
 ):
@@ -483,32 +684,24 @@ async def generate_subject_line_variants(
     """
     ai_service = AIGenerationService(db)
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         job = await ai_service.generate_subject_line_variants(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             user_id=current_user.id,
             request_data=request_data
         )
         
-        # Trigger background processing
-        background_tasks.add_task(
-            process_subject_line_generation.delay,
-            str(job.id)
-        )
+        # Return the connection to the pool before talking to the broker
+        await db.close()
+        
+        # Enqueue processing (job is committed)
+        await _enqueue_job(ai_service, job)
         
         return AIGenerationResponse(
             id=job.id,
             campaign_id=campaign_id,
-            status=AIJobStatus(job.status),
+            status=job.status,
             job_type=job.job_type,
             estimated_completion_seconds=15,
             created_at=job.created_at
@@ -533,9 +726,8 @@ async def generate_subject_line_variants(
     description="Regenerate email content with different options"
 )
 async def regenerate_email_content(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     generation_request: AIGenerationRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_member),
     db: AsyncSession = Depends(get_db)
 ):
@@ -555,47 +747,37 @@ async def regenerate_email_content(
     campaign_service = CampaignService(db)
     
     try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
-    try:
-        # Get campaign and increment iterations
-        campaign = await campaign_service.get_campaign(
-            campaign_id=campaign_uuid,
+        # Increment iterations and create the job in a single transaction
+        iterations = await campaign_service.increment_generation_iterations(
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id
         )
         
-        if not campaign:
+        if iterations is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Campaign not found"
             )
         
-        campaign.generation_iterations += 1
-        await ai_service.db.commit()
-        
-        # Create generation job
         job = await ai_service.create_generation_job(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             user_id=current_user.id,
             generation_request=generation_request
         )
+        await db.commit()
+        await campaign_service.invalidate_cache(current_user.organization_id, campaign_id)
         
-        # Trigger background processing
-        background_tasks.add_task(
-            process_email_generation.delay,
-            str(job.id)
-        )
+        # Return the connection to the pool before talking to the broker
+        await db.close()
+        
+        # Enqueue processing (job is committed)
+        await _enqueue_job(ai_service, job)
         
         return AIGenerationResponse(
             id=job.id,
             campaign_id=campaign_id,
-            status=AIJobStatus(job.status),
+            status=job.status,
             job_type=job.job_type,
             estimated_completion_seconds=30,
             created_at=job.created_at
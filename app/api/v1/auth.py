@@ -65,7 +65,7 @@ async def register(
             refresh_token=token_data["refresh_token"],
             token_type=token_data["token_type"],
             expires_in=token_data["expires_in"],
-            user=UserResponse.model_validate(user)
+            user=UserResponse.from_orm_trusted(user)
         )
         
     except ValueError as e:
@@ -117,7 +117,7 @@ async def login(
         refresh_token=token_data["refresh_token"],
         token_type=token_data["token_type"],
         expires_in=token_data["expires_in"],
-        user=UserResponse.model_validate(user)
+        user=UserResponse.from_orm_trusted(user)
     )
 
 
@@ -169,7 +169,7 @@ async def refresh_token(
         refresh_token=new_token_data["refresh_token"],
         token_type=new_token_data["token_type"],
         expires_in=new_token_data["expires_in"],
-        user=UserResponse.model_validate(user)
+        user=UserResponse.from_orm_trusted(user)
     )
 
 
@@ -222,7 +222,7 @@ async def get_current_user_info(
     Requires valid access token in Authorization header.
     Returns user profile data.
     """
-    return UserResponse.model_validate(current_user)
+    return UserResponse.from_orm_trusted(current_user)
 
 
 # ============================================
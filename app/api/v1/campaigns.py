@@ -1,12 +1,13 @@
 """
 Campaign endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from typing import List, Optional
 import uuid
 
-from core.database import get_db
+from core.cache import cache_get, cache_set, cache_get_json, cache_set_json
 from schemas.campaign import (
     CampaignCreate,
     CampaignUpdate,
@@ -18,15 +19,30 @@ from schemas.campaign import (
     CampaignObjectiveCreate,
     CampaignObjectiveUpdate,
     CampaignObjectiveResponse,
+    CampaignSortField,
+    SortOrder,
 )
 from schemas.auth import MessageResponse
-from services.campaign_service import CampaignService
-from api.deps import get_current_active_user, require_member
+from services.campaign_service import (
+    CampaignService,
+    CampaignValidationError,
+    InvalidStatusTransition,
+    campaign_cache_key,
+    campaign_objectives_cache_key,
+    campaign_stats_cache_key,
+    CAMPAIGN_CACHE_TTL,
+    CAMPAIGN_STATS_CACHE_TTL,
+)
+from api.deps import get_current_active_user, require_member, get_campaign_service
 from models.user import User
-import math
+from utils.http import conditional_json_response
 
 router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
 
+# Bulk validators for list responses (built once, reused per request)
+CAMPAIGN_LIST_ADAPTER = TypeAdapter(List[CampaignResponse])
+OBJECTIVE_LIST_ADAPTER = TypeAdapter(List[CampaignObjectiveResponse])
+
 
 # ============================================
 # CAMPAIGN CRUD
@@ -42,7 +58,7 @@ router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
 async def create_campaign(
     campaign_data: CampaignCreate,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Create a new campaign:
@@ -58,8 +74,6 @@ async def create_campaign(
     
     Requires authentication and member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
     try:
         campaign = await campaign_service.create_campaign(
             organization_id=current_user.organization_id,
@@ -67,7 +81,7 @@ async def create_campaign(
             campaign_data=campaign_data
         )
         return CampaignResponse.model_validate(campaign)
-    except Exception as e:
+    except (ValueError, CampaignValidationError) as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -84,11 +98,12 @@ async def list_campaigns(
     status_filter: Optional[List[CampaignStatusEnum]] = Query(None, alias="status"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-    sort_by: str = Query("created_at", pattern="^(created_at|updated_at|name|scheduled_at)$"),
-    order: str = Query("desc", pattern="^(asc|desc)$"),
+    sort_by: CampaignSortField = Query("created_at"),
+    order: SortOrder = Query("desc"),
     search: Optional[str] = Query(None, description="Search in name and description"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     List campaigns with filtering and pagination:
@@ -100,31 +115,53 @@ async def list_campaigns(
     - **sort_by**: Sort field (created_at, updated_at, name, scheduled_at)
     - **order**: Sort order (asc, desc)
     - **search**: Search term for campaign name or description
+    - **after**: Cursor for keyset pagination (created_at sort only); overrides page
     
     Returns paginated list of campaigns with total count and page info.
+    Cursor requests are not counted, so total, page and pages are null.
     """
-    campaign_service = CampaignService(db)
+    if after and sort_by != "created_at":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination requires sort_by=created_at"
+        )
     
-    campaigns, total = await campaign_service.list_campaigns(
-        organization_id=current_user.organization_id,
-        status=status_filter,
-        page=page,
-        per_page=per_page,
-        sort_by=sort_by,
-        order=order,
-        search=search
-    )
+    try:
+        campaigns, total, next_cursor = await campaign_service.list_campaigns(
+            organization_id=current_user.organization_id,
+            status=status_filter,
+            page=page,
+            per_page=per_page,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            after=after
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     # Calculate pagination info
-    pages = math.ceil(total / per_page) if total > 0 else 1
-    
-    return CampaignListResponse(
-        campaigns=[CampaignResponse.model_validate(c) for c in campaigns],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=pages
-    )
+    if after:
+        page = pages = None
+    else:
+        pages = (total + per_page - 1) // per_page if total else 1
+    
+    # Validate the whole page in one pass and serialize straight to JSON,
+    # skipping FastAPI's second response_model validation
+    return ORJSONResponse({
+        "campaigns": CAMPAIGN_LIST_ADAPTER.dump_python(
+            CAMPAIGN_LIST_ADAPTER.validate_python(campaigns, from_attributes=True),
+            mode="json"
+        ),
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": pages,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get(
@@ -135,7 +172,7 @@ async def list_campaigns(
 )
 async def get_campaign_stats(
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Get campaign statistics:
@@ -143,12 +180,17 @@ async def get_campaign_stats(
     Returns counts of campaigns by status and overall statistics.
     Useful for dashboard widgets and overview pages.
     """
-    campaign_service = CampaignService(db)
+    cache_key = campaign_stats_cache_key(current_user.organization_id)
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
     
     stats = await campaign_service.get_campaign_stats(
         organization_id=current_user.organization_id
     )
     
+    await cache_set_json(cache_key, stats, CAMPAIGN_STATS_CACHE_TTL)
+    
     return CampaignStatsResponse(**stats)
 
 
@@ -159,29 +201,27 @@ async def get_campaign_stats(
     description="Get a specific campaign by ID"
 )
 async def get_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Get a campaign by ID:
     
     - **campaign_id**: UUID of the campaign
     
-    Returns full campaign details including objectives.
+    Returns full campaign details including objectives. Supports conditional
+    requests: send the returned ETag as If-None-Match to get 304 when unchanged.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
+    # Cached entry is the serialized body, so a hit is served (or 304'd) as-is
+    cache_key = campaign_cache_key(current_user.organization_id, campaign_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return conditional_json_response(request, cached.encode())
     
     campaign = await campaign_service.get_campaign(
-        campaign_id=campaign_uuid,
+        campaign_id=campaign_id,
         organization_id=current_user.organization_id
     )
     
@@ -191,7 +231,10 @@ async def get_campaign(
             detail="Campaign not found"
         )
     
-    return CampaignResponse.model_validate(campaign)
+    body = CampaignResponse.model_validate(campaign).model_dump_json().encode()
+    await cache_set(cache_key, body, CAMPAIGN_CACHE_TTL)
+    
+    return conditional_json_response(request, body)
 
 
 @router.patch(
@@ -201,10 +244,10 @@ async def get_campaign(
     description="Update a campaign's details"
 )
 async def update_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     campaign_data: CampaignUpdate,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Update a campaign:
@@ -215,19 +258,9 @@ async def update_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         campaign = await campaign_service.update_campaign(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             campaign_data=campaign_data
         )
@@ -254,9 +287,9 @@ async def update_campaign(
     description="Delete a campaign"
 )
 async def delete_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Delete a campaign:
@@ -266,19 +299,9 @@ async def delete_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         deleted = await campaign_service.delete_campaign(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id
         )
         
@@ -309,9 +332,9 @@ async def delete_campaign(
     description="Create a copy of an existing campaign"
 )
 async def duplicate_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Duplicate a campaign:
@@ -323,19 +346,9 @@ async def duplicate_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         duplicate = await campaign_service.duplicate_campaign(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             created_by=current_user.id
         )
@@ -356,9 +369,9 @@ async def duplicate_campaign(
     description="Archive a campaign"
 )
 async def archive_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Archive a campaign:
@@ -369,19 +382,9 @@ async def archive_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         campaign = await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             new_status=CampaignStatusEnum.ARCHIVED
         )
@@ -408,10 +411,10 @@ async def archive_campaign(
     description="Schedule a campaign for sending"
 )
 async def schedule_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     schedule_data: CampaignScheduleRequest,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Schedule a campaign:
@@ -422,19 +425,9 @@ async def schedule_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         campaign = await campaign_service.schedule_campaign(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             scheduled_at=schedule_data.scheduled_at
         )
@@ -461,33 +454,25 @@ async def schedule_campaign(
     description="Send campaign immediately"
 )
 async def send_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Send campaign immediately:
     
     - **campaign_id**: UUID of the campaign
     - Changes status to sending
-    - Campaign must be ready to send
+    - Campaign must be scheduled or paused; otherwise returns 409, which is
+      also what a concurrent duplicate send gets
     - Actual email sending handled by background worker
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
+        # Conditional UPDATE: only one of several concurrent sends can match
         campaign = await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             new_status=CampaignStatusEnum.SENDING
         )
@@ -503,6 +488,11 @@ async def send_campaign(
         
         return CampaignResponse.model_validate(campaign)
     
+    except InvalidStatusTransition as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Campaign is not in a sendable state: {e}"
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -517,9 +507,9 @@ async def send_campaign(
     description="Pause a sending or scheduled campaign"
 )
 async def pause_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Pause a campaign:
@@ -530,19 +520,9 @@ async def pause_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         campaign = await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             new_status=CampaignStatusEnum.PAUSED
         )
@@ -569,9 +549,9 @@ async def pause_campaign(
     description="Resume a paused campaign"
 )
 async def resume_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Resume a paused campaign:
@@ -582,19 +562,9 @@ async def resume_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         campaign = await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             new_status=CampaignStatusEnum.SCHEDULED
         )
@@ -621,9 +591,9 @@ async def resume_campaign(
     description="Cancel a scheduled campaign"
 )
 async def cancel_campaign(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Cancel a scheduled campaign:
@@ -634,20 +604,9 @@ async def cancel_campaign(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
-        # Get campaign first
-        campaign = await campaign_service.get_campaign(
-            campaign_id=campaign_uuid,
+        campaign = await campaign_service.cancel_campaign(
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id
         )
         
@@ -657,16 +616,6 @@ async def cancel_campaign(
                 detail="Campaign not found"
             )
         
-        # Clear scheduled time
-        campaign.scheduled_at = None
-        
-        # Change to draft
-        campaign = await campaign_service.change_campaign_status(
-            campaign_id=campaign_uuid,
-            organization_id=current_user.organization_id,
-            new_status=CampaignStatusEnum.DRAFT
-        )
-        
         return CampaignResponse.model_validate(campaign)
     
     except ValueError as e:
@@ -687,39 +636,41 @@ async def cancel_campaign(
     description="Get all objectives for a campaign"
 )
 async def list_objectives(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     List campaign objectives:
     
     - **campaign_id**: UUID of the campaign
     
-    Returns list of all objectives for the campaign.
+    Returns list of all objectives for the campaign. Supports conditional
+    requests via ETag / If-None-Match.
     """
-    campaign_service = CampaignService(db)
+    cache_key = campaign_objectives_cache_key(current_user.organization_id, campaign_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return conditional_json_response(request, cached.encode())
     
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
-    campaign = await campaign_service.get_campaign(
-        campaign_id=campaign_uuid,
+    campaign_objectives = await campaign_service.get_objectives(
+        campaign_id=campaign_id,
         organization_id=current_user.organization_id
     )
     
-    if not campaign:
+    if campaign_objectives is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found"
         )
     
-    return [CampaignObjectiveResponse.model_validate(obj) for obj in campaign.objectives]
+    body = OBJECTIVE_LIST_ADAPTER.dump_json(
+        OBJECTIVE_LIST_ADAPTER.validate_python(campaign_objectives, from_attributes=True)
+    )
+    await cache_set(cache_key, body, CAMPAIGN_CACHE_TTL)
+    
+    return conditional_json_response(request, body)
 
 
 @router.post(
@@ -730,10 +681,10 @@ async def list_objectives(
     description="Add a new objective to a campaign"
 )
 async def create_objective(
-    campaign_id: str,
+    campaign_id: uuid.UUID,
     objective_data: CampaignObjectiveCreate,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Create campaign objective:
@@ -747,19 +698,9 @@ async def create_objective(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid campaign ID format"
-        )
-    
     try:
         objective = await campaign_service.create_objective(
-            campaign_id=campaign_uuid,
+            campaign_id=campaign_id,
             organization_id=current_user.organization_id,
             objective_data=objective_data
         )
@@ -780,11 +721,11 @@ async def create_objective(
     description="Update an existing campaign objective"
 )
 async def update_objective(
-    campaign_id: str,
-    objective_id: str,
+    campaign_id: uuid.UUID,
+    objective_id: uuid.UUID,
     objective_data: CampaignObjectiveUpdate,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Update campaign objective:
@@ -795,20 +736,9 @@ async def update_objective(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        objective_uuid = uuid.UUID(objective_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
-        )
-    
     objective = await campaign_service.update_objective(
-        objective_id=objective_uuid,
-        campaign_id=campaign_uuid,
+        objective_id=objective_id,
+        campaign_id=campaign_id,
         organization_id=current_user.organization_id,
         objective_data=objective_data
     )
@@ -829,10 +759,10 @@ async def update_objective(
     description="Delete a campaign objective"
 )
 async def delete_objective(
-    campaign_id: str,
-    objective_id: str,
+    campaign_id: uuid.UUID,
+    objective_id: uuid.UUID,
     current_user: User = Depends(require_member),
-    db: AsyncSession = Depends(get_db)
+    campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Delete campaign objective:
@@ -842,20 +772,9 @@ async def delete_objective(
     
     Requires member role or higher.
     """
-    campaign_service = CampaignService(db)
-    
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        objective_uuid = uuid.UUID(objective_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid ID format"
-        )
-    
     deleted = await campaign_service.delete_objective(
-        objective_id=objective_uuid,
-        campaign_id=campaign_uuid,
+        objective_id=objective_id,
+        campaign_id=campaign_id,
         organization_id=current_user.organization_id
     )
     
@@ -5,20 +5,28 @@ from core.config import settings
 from core.security import (
     hash_password,
     verify_password,
+    ahash_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
     create_password_reset_token,
     decode_token,
     verify_password_reset_token,
+    generate_random_token,
+    generate_random_tokens,
 )
 
 __all__ = [
     "settings",
     "hash_password",
     "verify_password",
+    "ahash_password",
+    "averify_password",
     "create_access_token",
     "create_refresh_token",
     "create_password_reset_token",
     "decode_token",
     "verify_password_reset_token",
+    "generate_random_token",
+    "generate_random_tokens",
 ]
\ No newline at end of file
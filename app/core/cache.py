@@ -0,0 +1,129 @@
+"""
+Redis cache client and helpers
+
+The cache is strictly best-effort: every helper swallows Redis errors so that
+an unavailable Redis degrades to a cache miss instead of failing the request.
+"""
+import json
+import uuid
+from typing import Optional, Any, Dict, Union
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import settings
+
+
+# Shared async client (connection pool is created lazily on first command)
+redis_client: Redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """
+    Read a cached value
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached value or None on miss / Redis error
+    """
+    try:
+        return await redis_client.get(key)
+    except RedisError:
+        return None
+
+
+async def cache_set(key: str, value: Union[str, bytes], ttl: int, nx: bool = False) -> Optional[bool]:
+    """
+    Store a value with a TTL
+
+    Args:
+        key: Cache key
+        value: Value to store
+        ttl: Time to live in seconds
+        nx: Only set the key if it does not already exist
+
+    Returns:
+        True if stored, False if nx was set and the key already existed,
+        None if Redis is unavailable
+    """
+    try:
+        return bool(await redis_client.set(key, value, ex=ttl, nx=nx))
+    except RedisError:
+        return None
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """
+    Read a JSON document from the cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value or None on miss / Redis error
+    """
+    cached = await cache_get(key)
+    if cached is None:
+        return None
+    return orjson.loads(cached)
+
+
+async def cache_set_json(key: str, obj: Any, ttl: int = 300) -> None:
+    """
+    Store a JSON-serializable value in the cache
+
+    Args:
+        key: Cache key
+        obj: Value to store
+        ttl: Time to live in seconds
+    """
+    await cache_set(key, orjson.dumps(obj), ttl)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Delete cached keys
+
+    Args:
+        keys: Keys to delete
+    """
+    if not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except RedisError:
+        pass
+
+
+def job_events_channel(job_id: Union[str, uuid.UUID]) -> str:
+    """Pub/sub channel carrying status updates for a generation job"""
+    return f"aijob:{job_id}"
+
+
+async def publish_job_event(job_id: Union[str, uuid.UUID], payload: Dict[str, Any]) -> None:
+    """
+    Publish a job status update to subscribers of the job's channel
+
+    Uses a short-lived client rather than the shared one, because Celery tasks
+    run each job in a fresh event loop (asyncio.run) and a pooled connection
+    cannot be reused across loops.
+
+    Args:
+        job_id: Generation job UUID
+        payload: JSON-serializable event payload
+    """
+    client = Redis.from_url(settings.REDIS_URL)
+    try:
+        await client.publish(job_events_channel(job_id), json.dumps(payload))
+    except RedisError:
+        pass
+    finally:
+        await client.aclose()
+
+
+async def close_cache() -> None:
+    """Close the shared Redis connection pool"""
+    await redis_client.aclose()
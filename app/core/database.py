@@ -3,22 +3,49 @@ Database configuration and session management
 """
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
+from sqlalchemy import text
 from typing import AsyncGenerator
-import os
-from dotenv import load_dotenv
+import time
+import uuid
 
-load_dotenv()
+from core.config import settings
 
 # Database URL
-DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_URL = settings.DATABASE_URL
+
+# Per-connection prepared statement cache size (0 disables reuse)
+STATEMENT_CACHE_SIZE = settings.DB_STATEMENT_CACHE_SIZE
 
 # Create async engine
 engine_kwargs = {
     "echo": False,
     "future": True,
+    # Compiled SQL cache shared by all connections (SQLAlchemy default is 500)
+    "query_cache_size": 1200,
+    "connect_args": {
+        # Queries are short OLTP statements; JIT compilation only adds latency
+        "server_settings": {"jit": "off"},
+        # Per-connection caches of server-side prepared statements, so repeated
+        # queries skip parse/plan (SQLAlchemy adapter and asyncpg respectively)
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+    },
 }
 
-if os.getenv("CELERY_WORKER"):
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer (transaction pooling) multiplexes clients onto its own backend
+    # pool, so keep no local pool. Server connections change between
+    # transactions, so named prepared statements cannot be cached or reused.
+    # PgBouncer also rejects unknown startup parameters, so jit is not sent per
+    # connection; set it on the role instead (ALTER ROLE ... SET jit = off).
+    engine_kwargs["poolclass"] = NullPool
+    engine_kwargs["connect_args"].pop("server_settings")
+    engine_kwargs["connect_args"].update({
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    })
+elif settings.CELERY_WORKER:
     engine_kwargs["poolclass"] = NullPool
 else:
     engine_kwargs["pool_pre_ping"] = True
@@ -82,12 +109,24 @@ async def close_db():
 
 
 # Health check function
+# Seconds a health check result is reused, so frequent probes share one query
+DB_HEALTH_CHECK_TTL = 2.0
+_last_db_check = {"checked_at": float("-inf"), "ok": False}
+
+
 async def check_db_connection() -> bool:
-    """Check if database is accessible"""
+    """Check if database is accessible (result cached for DB_HEALTH_CHECK_TTL seconds)"""
+    now = time.monotonic()
+    if now - _last_db_check["checked_at"] < DB_HEALTH_CHECK_TTL:
+        return _last_db_check["ok"]
+    
     try:
         async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
-        return True
+            await conn.execute(text("SELECT 1"))
+        ok = True
     except Exception as e:
         print(f"Database connection failed: {e}")
-        return False
\ No newline at end of file
+        ok = False
+    
+    _last_db_check.update(checked_at=time.monotonic(), ok=ok)
+    return ok
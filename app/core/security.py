@@ -1,16 +1,43 @@
 """
 Security utilities for password hashing and JWT tokens
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Dict, Any, List, Tuple
+from jose import JWTError, jwk, jwt
+import asyncio
+import base64
+import bcrypt
+import os
 import secrets
+import threading
+import time
 
 from core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Dedicated pool for bcrypt work so hashing neither blocks the event loop nor
+# competes with other to_thread users (bcrypt releases the GIL while hashing)
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+# Token signing parameters, bound once at import. Keys are constructed up front:
+# given a plain string, jose tries to parse it as a JWK and rebuilds the key on
+# every encode/decode.
+_ALGORITHM = settings.ALGORITHM
+_SIGNING_KEY = jwk.construct(settings.SECRET_KEY, _ALGORITHM)
+_VERIFY_KEY = _SIGNING_KEY if _ALGORITHM.startswith("HS") else _SIGNING_KEY.public_key()
+_ACCESS_TOKEN_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_DELTA = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+_PASSWORD_RESET_TOKEN_DELTA = timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS)
+
+# Decoded-token cache: raw token -> (payload, exp). Only successfully verified
+# tokens carrying an exp claim are stored, and entries are dropped once exp passes.
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 # ============================================
@@ -27,7 +54,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -41,7 +69,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
+
+
+async def ahash_password(password: str) -> str:
+    """
+    Hash a password on the bcrypt thread pool
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash on the bcrypt thread pool
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
 
 
 # ============================================
@@ -62,25 +128,18 @@ def create_access_token(
     Returns:
         Encoded JWT token
     """
-    to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+    now = datetime.utcnow()
+    to_encode = {
+        **data,
+        "exp": now + (expires_delta or _ACCESS_TOKEN_DELTA),
+        "iat": now,
         "type": "access"
-    })
+    }
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SIGNING_KEY,
+        algorithm=_ALGORITHM
     )
     
     return encoded_jwt
@@ -100,25 +159,18 @@ def create_refresh_token(
     Returns:
         Encoded JWT token
     """
-    to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-    
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+    now = datetime.utcnow()
+    to_encode = {
+        **data,
+        "exp": now + (expires_delta or _REFRESH_TOKEN_DELTA),
+        "iat": now,
         "type": "refresh"
-    })
+    }
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SIGNING_KEY,
+        algorithm=_ALGORITHM
     )
     
     return encoded_jwt
@@ -134,20 +186,19 @@ def create_password_reset_token(email: str) -> str:
     Returns:
         Password reset token
     """
-    delta = timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS)
-    expire = datetime.utcnow() + delta
+    now = datetime.utcnow()
     
     to_encode = {
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + _PASSWORD_RESET_TOKEN_DELTA,
+        "iat": now,
         "sub": email,
         "type": "password_reset"
     }
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SIGNING_KEY,
+        algorithm=_ALGORITHM
     )
     
     return encoded_jwt
@@ -157,21 +208,42 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT token
     
+    Verified payloads are cached per token until the token's own expiry, so
+    a bearer token reused across requests is only verified once.
+    
     Args:
         token: JWT token to decode
         
     Returns:
         Decoded token data or None if invalid
     """
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            payload, exp = cached
+            if time.time() < exp:
+                _token_cache.move_to_end(token)
+                return dict(payload)
+            del _token_cache[token]
+    
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+            _VERIFY_KEY,
+            algorithms=[_ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+    
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[token] = (payload, float(exp))
+            if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+        return dict(payload)
+    
+    return payload
 
 
 def verify_password_reset_token(token: str) -> Optional[str]:
@@ -206,4 +278,26 @@ def generate_random_token(length: int = 32) -> str:
     Returns:
         Random token string
     """
-    return secrets.token_urlsafe(length)
\ No newline at end of file
+    return secrets.token_urlsafe(length)
+
+
+def generate_random_tokens(count: int, length: int = 32) -> List[str]:
+    """
+    Generate several random tokens from a single entropy read
+    
+    Produces the same format as generate_random_token (URL-safe base64 of
+    `length` random bytes) but reads all the randomness in one call, which
+    matters when provisioning tokens in bulk.
+    
+    Args:
+        count: Number of tokens
+        length: Length of each token in random bytes
+        
+    Returns:
+        List of random token strings
+    """
+    raw = secrets.token_bytes(length * count)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + length]).rstrip(b"=").decode("ascii")
+        for i in range(0, length * count, length)
+    ]
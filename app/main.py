@@ -3,13 +3,15 @@ FastAPI application entry point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
+import orjson
 
 from core.config import settings
-from core.database import init_db, close_db
+from core.database import init_db, close_db, check_db_connection
+from core.cache import close_cache
 from api.v1.auth import router as auth_router
 from api.v1.campaigns import router as campaigns_router
-from api.v1.ai_generation import router as ai_generation_router
 
 
 @asynccontextmanager
@@ -27,6 +29,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down...")
     await close_db()
+    await close_cache()
 
 
 # Create FastAPI application
@@ -35,6 +38,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="AI-powered B2B email marketing platform",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -51,19 +55,42 @@ app.add_middleware(
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(campaigns_router, prefix="/api/v1")
-app.include_router(ai_generation_router, prefix="/api/v1")
 
-# Health check endpoint
+# The AI generation router (and the Anthropic client it pulls in) is only
+# mounted when an API key is configured
+if settings.ANTHROPIC_API_KEY:
+    from api.v1.ai_generation import router as ai_generation_router
+    app.include_router(ai_generation_router, prefix="/api/v1")
+else:
+    print("ANTHROPIC_API_KEY not set, AI generation endpoints disabled")
+
+# Health response never changes for the life of the process, so serialize it once
+_HEALTH = orjson.dumps({
+    "status": "healthy",
+    "app_name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT,
+    "anthropic_configured": bool(settings.ANTHROPIC_API_KEY),
+})
+
+
+# Health check endpoint (liveness)
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "anthropic_configured": bool(settings.ANTHROPIC_API_KEY)
-    }
+    return Response(content=_HEALTH, media_type="application/json")
+
+
+# Readiness endpoint
+@app.get("/ready", tags=["Health"])
+async def readiness_check():
+    """Readiness check endpoint (503 while the database is unreachable)"""
+    if await check_db_connection():
+        return {"status": "ready", "database": "connected"}
+    return ORJSONResponse(
+        status_code=503,
+        content={"status": "unavailable", "database": "unavailable"}
+    )
 
 
 # Root endpoint
@@ -91,5 +118,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        loop="uvloop",
         log_level="info"
     )
\ No newline at end of file
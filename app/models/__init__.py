@@ -1,7 +1,7 @@
 """
 SQLAlchemy ORM Models
 """
-from models.base import Base, TimestampMixin, UUIDMixin
+from models.base import Base, TimestampMixin, UUIDMixin, UUIDv7Mixin
 
 # Import all models to ensure they're registered with Base
 from models.organization import Organization, CompanyProfile
@@ -9,12 +9,20 @@ from models.user import User
 from models.campaign import Campaign, CampaignObjective
 from models.template import EmailTemplate, EmailRevision, AIGenerationJob
 from models.contact import Contact, ContactList, ContactListMember, CampaignRecipient
-from models.analytics import CampaignAnalytics, EmailEvent, AuditLog
+from models.analytics import (
+    CampaignAnalytics,
+    EmailEvent,
+    EmailEventType,
+    CampaignRecipientStats,
+    RollupWatermark,
+    AuditLog,
+)
 
 __all__ = [
     "Base",
     "TimestampMixin",
     "UUIDMixin",
+    "UUIDv7Mixin",
     # Organization
     "Organization",
     "CompanyProfile",
@@ -35,5 +43,8 @@ __all__ = [
     # Analytics
     "CampaignAnalytics",
     "EmailEvent",
+    "EmailEventType",
+    "CampaignRecipientStats",
+    "RollupWatermark",
     "AuditLog",
 ]
\ No newline at end of file
@@ -1,14 +1,34 @@
 """
 Analytics and tracking models
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Boolean, Numeric, Index, DECIMAL
+from sqlalchemy import Column, Computed, DDL, String, Integer, ForeignKey, DateTime, Text, Boolean, Numeric, Index, DECIMAL, event, func, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB, INET
 from typing import Optional, List
 from datetime import datetime
+import enum
 import uuid
 
-from .base import Base, TimestampMixin, UUIDMixin
+from .base import Base, SmallIntEnum, TimestampMixin, UUIDMixin, UUIDv7Mixin
+
+
+class EmailEventType(int, enum.Enum):
+    """Email event types, stored as SMALLINT codes (never renumber)"""
+    SENT = 1
+    DELIVERED = 2
+    OPENED = 3
+    CLICKED = 4
+    BOUNCED = 5
+    UNSUBSCRIBED = 6
+    COMPLAINED = 7
+
+
+def _rate_expression(numerator: str, denominator: str) -> str:
+    """SQL for a percentage of two counters, NULL while the denominator is zero"""
+    return (
+        f"CASE WHEN {denominator} > 0 "
+        f"THEN round({numerator}::numeric / {denominator} * 100, 2) END"
+    )
 
 
 class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
@@ -16,6 +36,9 @@ class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
     Aggregated analytics for campaigns
     """
     __tablename__ = "campaign_analytics"
+    # Read the generated rate columns back via RETURNING after each write
+    # instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
     # Foreign Key (One-to-One with Campaign)
     campaign_id: Mapped[uuid.UUID] = mapped_column(
@@ -30,24 +53,28 @@ class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
     total_sent: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total emails sent"
     )
     total_delivered: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total emails delivered"
     )
     total_bounced: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total bounced emails"
     )
     total_failed: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total failed sends"
     )
@@ -56,63 +83,75 @@ class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
     total_opens: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total opens (including duplicates)"
     )
     unique_opens: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Unique opens"
     )
     total_clicks: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total clicks (including duplicates)"
     )
     unique_clicks: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Unique clicks"
     )
     total_unsubscribes: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total unsubscribes"
     )
     total_spam_reports: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total spam complaints"
     )
     
-    # Calculated Rates (stored as percentages)
+    # Calculated Rates (stored as percentages, maintained by PostgreSQL from
+    # the counters above)
     delivery_rate: Mapped[Optional[float]] = mapped_column(
         DECIMAL(5, 2),
+        Computed(_rate_expression("total_delivered", "total_sent"), persisted=True),
         nullable=True,
         comment="Delivery rate percentage"
     )
     open_rate: Mapped[Optional[float]] = mapped_column(
         DECIMAL(5, 2),
+        Computed(_rate_expression("unique_opens", "total_delivered"), persisted=True),
         nullable=True,
         comment="Open rate percentage"
     )
     click_rate: Mapped[Optional[float]] = mapped_column(
         DECIMAL(5, 2),
+        Computed(_rate_expression("unique_clicks", "total_delivered"), persisted=True),
         nullable=True,
         comment="Click rate percentage"
     )
     click_to_open_rate: Mapped[Optional[float]] = mapped_column(
         DECIMAL(5, 2),
+        Computed(_rate_expression("unique_clicks", "unique_opens"), persisted=True),
         nullable=True,
         comment="Click-to-open rate percentage"
     )
     unsubscribe_rate: Mapped[Optional[float]] = mapped_column(
         DECIMAL(5, 2),
+        Computed(_rate_expression("total_unsubscribes", "total_delivered"), persisted=True),
         nullable=True,
         comment="Unsubscribe rate percentage"
     )
@@ -121,6 +160,7 @@ class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
     goal_achieved: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
+        server_default=text("false"),
         nullable=False,
         comment="Whether campaign goal was achieved"
     )
@@ -130,56 +170,38 @@ class CampaignAnalytics(Base, UUIDMixin, TimestampMixin):
         comment="Goal completion percentage"
     )
     
-    # Metadata
-    last_calculated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        comment="Last time analytics were calculated"
-    )
-    
     # Relationships
     campaign: Mapped["Campaign"] = relationship(
         "Campaign",
         back_populates="analytics"
     )
     
-    def calculate_rates(self) -> None:
-        """Calculate all rate metrics"""
-        # Delivery rate
-        if self.total_sent > 0:
-            self.delivery_rate = (self.total_delivered / self.total_sent) * 100
-        
-        # Open rate (based on delivered)
-        if self.total_delivered > 0:
-            self.open_rate = (self.unique_opens / self.total_delivered) * 100
-        
-        # Click rate (based on delivered)
-        if self.total_delivered > 0:
-            self.click_rate = (self.unique_clicks / self.total_delivered) * 100
-        
-        # Click-to-open rate
-        if self.unique_opens > 0:
-            self.click_to_open_rate = (self.unique_clicks / self.unique_opens) * 100
-        
-        # Unsubscribe rate
-        if self.total_delivered > 0:
-            self.unsubscribe_rate = (self.total_unsubscribes / self.total_delivered) * 100
-        
-        self.last_calculated_at = datetime.utcnow()
-    
     def __repr__(self) -> str:
         return f"<CampaignAnalytics(campaign_id={self.campaign_id}, sent={self.total_sent}, opens={self.unique_opens})>"
 
 
-class EmailEvent(Base, UUIDMixin):
+class EmailEvent(Base, UUIDv7Mixin):
     """
     Individual email events for detailed tracking
     """
     __tablename__ = "email_events"
     __table_args__ = (
-        Index('idx_email_events_recipient', 'campaign_recipient_id'),
-        Index('idx_email_events_type', 'event_type'),
-        Index('idx_email_events_occurred', 'occurred_at'),
+        # Per-recipient event lookups filtered by type and ordered by time
+        Index('idx_email_events_lookup', 'campaign_recipient_id', 'event_type', 'occurred_at'),
+        # Events are appended in time order, so a BRIN index serves time-range
+        # scans at a fraction of a B-tree's size
+        Index('idx_email_events_occurred_brin', 'occurred_at', postgresql_using='brin'),
+        # Rollup watermark scans (created_at > processed_until)
+        Index('idx_email_events_created_brin', 'created_at', postgresql_using='brin'),
+        # Bounce dashboards
+        Index(
+            'idx_email_events_bounce',
+            'campaign_recipient_id',
+            postgresql_where=text(f"event_type = {EmailEventType.BOUNCED.value}")
+        ),
+        # Monthly range partitions (see ensure_email_events_partition in the
+        # migrations and the partition maintenance task)
+        {'postgresql_partition_by': 'RANGE (occurred_at)'},
     )
 
     # Foreign Key
@@ -191,10 +213,10 @@ class EmailEvent(Base, UUIDMixin):
     )
     
     # Event Details
-    event_type: Mapped[str] = mapped_column(
-        String(50),
+    event_type: Mapped[EmailEventType] = mapped_column(
+        SmallIntEnum(EmailEventType),
         nullable=False,
-        comment="Event type: sent, delivered, opened, clicked, bounced, unsubscribed, complained"
+        comment="EmailEventType code: 1 sent, 2 delivered, 3 opened, 4 clicked, 5 bounced, 6 unsubscribed, 7 complained"
     )
     
     # Event Data (flexible JSON for event-specific data)
@@ -207,6 +229,7 @@ class EmailEvent(Base, UUIDMixin):
     # Timestamps
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,  # Partition key must be part of the primary key
         nullable=False,
         server_default="now()",
         comment="When event occurred"
@@ -228,7 +251,133 @@ class EmailEvent(Base, UUIDMixin):
         return f"<EmailEvent(id={self.id}, type='{self.event_type}', occurred_at={self.occurred_at})>"
 
 
-class AuditLog(Base, UUIDMixin):
+# Tables created via metadata.create_all (init_db) get a catch-all partition so
+# inserts work before any monthly partitions exist
+event.listen(
+    EmailEvent.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS email_events_default PARTITION OF email_events DEFAULT")
+)
+
+
+class CampaignRecipientStats(Base):
+    """
+    Per-recipient open/click rollup of email_events
+    
+    Maintained incrementally by the rollup_campaign_recipient_stats task from
+    events recorded since the RollupWatermark, so tracking hits only ever
+    append to email_events instead of updating a recipient row.
+    """
+    __tablename__ = "campaign_recipient_stats"
+    __table_args__ = (
+        # Per-campaign engagement aggregates as index-only scans
+        Index(
+            'ix_recipient_stats_campaign',
+            'campaign_id',
+            postgresql_include=['open_count', 'click_count']
+        ),
+    )
+
+    campaign_recipient_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("campaign_recipients.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to campaign recipient"
+    )
+    campaign_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Recipient's campaign (denormalized for per-campaign aggregates)"
+    )
+    
+    # Open Tracking
+    open_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default=text("0"),
+        nullable=False,
+        comment="Number of times opened"
+    )
+    first_opened_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="First open timestamp"
+    )
+    last_opened_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last open timestamp"
+    )
+    
+    # Click Tracking
+    click_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default=text("0"),
+        nullable=False,
+        comment="Number of clicks"
+    )
+    first_clicked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="First click timestamp"
+    )
+    last_clicked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last click timestamp"
+    )
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the rollup last changed"
+    )
+    
+    # Relationships
+    recipient: Mapped["CampaignRecipient"] = relationship(
+        "CampaignRecipient",
+        back_populates="stats"
+    )
+    
+    @property
+    def opened(self) -> bool:
+        """Whether the email was opened"""
+        return self.open_count > 0
+    
+    @property
+    def clicked(self) -> bool:
+        """Whether any link was clicked"""
+        return self.click_count > 0
+    
+    def __repr__(self) -> str:
+        return f"<CampaignRecipientStats(recipient_id={self.campaign_recipient_id}, opens={self.open_count}, clicks={self.click_count})>"
+
+
+class RollupWatermark(Base):
+    """
+    Progress marker for incremental rollups over email_events
+    """
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Rollup name"
+    )
+    processed_until: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Events recorded before this time have been rolled up"
+    )
+    
+    def __repr__(self) -> str:
+        return f"<RollupWatermark(name='{self.name}', processed_until={self.processed_until})>"
+
+
+class AuditLog(Base, UUIDv7Mixin):
     """
     Audit log for tracking all actions in the system
     """
@@ -3,9 +3,12 @@ Base models and mixins for SQLAlchemy ORM
 """
 from datetime import datetime
 from typing import Any
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import CheckConstraint, Column, DateTime, SmallInteger, TypeDecorator, func, text
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 from sqlalchemy.dialects.postgresql import UUID
+import enum
+import os
+import time
 import uuid
 
 
@@ -14,6 +17,48 @@ class Base(DeclarativeBase):
     pass
 
 
+def enum_check(column: str, enum_cls: type[enum.Enum], name: str) -> CheckConstraint:
+    """
+    CHECK constraint limiting a string column to the values of an enum
+    
+    Args:
+        column: Column name
+        enum_cls: Enum whose member values are allowed
+        name: Constraint name
+        
+    Returns:
+        CheckConstraint for the table's __table_args__
+    """
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Integer enum stored as its SMALLINT code
+    
+    Binds enum members (or plain ints) as their integer value and returns
+    enum members on load.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_cls: type[enum.Enum], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.enum_cls = enum_cls
+    
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        return int(self.enum_cls(value))
+    
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        return self.enum_cls(value)
+
+
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamps"""
     
@@ -34,16 +79,51 @@ class TimestampMixin:
 
 
 class UUIDMixin:
-    """Mixin to add UUID primary key"""
+    """
+    Mixin to add UUID primary key
+    
+    The id is generated by Postgres (gen_random_uuid()) unless the caller sets
+    one; the ORM reads it back with RETURNING on flush.
+    """
     
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
+        comment="Unique identifier"
+    )
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562): 48-bit Unix millisecond timestamp followed
+    by 74 random bits
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    # Version (7) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+class UUIDv7Mixin:
+    """
+    Mixin to add a time-ordered (UUIDv7) primary key
+    
+    For append-heavy tables: new ids sort after existing ones, so inserts land
+    on the right-most primary key index page instead of splitting random pages.
+    """
+    
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
         comment="Unique identifier"
     )
 
 
 def generate_uuid() -> uuid.UUID:
     """Generate a new UUID"""
-    return uuid.uuid4()
\ No newline at end of file
+    return uuid.uuid4()
+
@@ -1,15 +1,15 @@
 """
 Campaign models
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Computed, String, Integer, ForeignKey, DateTime, Text, Index, text
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from typing import Optional, List
 from datetime import datetime
 import uuid
 import enum
 
-from .base import Base, TimestampMixin, UUIDMixin
+from .base import Base, TimestampMixin, UUIDMixin, enum_check
 
 
 class CampaignStatus(str, enum.Enum):
@@ -38,13 +38,29 @@ class Campaign(Base, UUIDMixin, TimestampMixin):
     Campaign model representing an email marketing campaign
     """
     __tablename__ = "campaigns"
+    __table_args__ = (
+        enum_check('status', CampaignStatus, 'ck_campaigns_status'),
+        # One index per list_campaigns sort key, all scoped to the organization,
+        # so a page is read in order from the index instead of sorted
+        Index(
+            'ix_campaigns_org_status_created',
+            'organization_id',
+            'status',
+            text('created_at DESC')
+        ),
+        Index('ix_campaigns_org_created', 'organization_id', text('created_at DESC')),
+        Index('ix_campaigns_org_updated', 'organization_id', text('updated_at DESC')),
+        Index('ix_campaigns_org_name', 'organization_id', 'name'),
+        Index('ix_campaigns_org_scheduled', 'organization_id', 'scheduled_at'),
+        # Full-text search over name/description
+        Index('ix_campaigns_search', 'search_vector', postgresql_using='gin'),
+    )
 
     # Foreign Keys
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to organization"
     )
     created_by: Mapped[uuid.UUID] = mapped_column(
@@ -66,9 +82,20 @@ class Campaign(Base, UUIDMixin, TimestampMixin):
         nullable=True,
         comment="Campaign description"
     )
-    status: Mapped[CampaignStatus] = mapped_column(
-        SQLEnum(CampaignStatus, native_enum=False, length=50),
-        default=CampaignStatus.DRAFT,
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+            persisted=True
+        ),
+        deferred=True,  # Only used in WHERE clauses, never loaded
+        comment="Full-text search document for name and description"
+    )
+    # Plain string holding a CampaignStatus value; coerced in _validate_status
+    status: Mapped[str] = mapped_column(
+        String(50),
+        default=CampaignStatus.DRAFT.value,
+        server_default=text("'draft'"),
         nullable=False,
         index=True,
         comment="Campaign status"
@@ -125,6 +152,7 @@ class Campaign(Base, UUIDMixin, TimestampMixin):
     generation_iterations: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Number of AI generation iterations"
     )
@@ -139,45 +167,62 @@ class Campaign(Base, UUIDMixin, TimestampMixin):
         back_populates="campaigns_created",
         foreign_keys=[created_by]
     )
+    # Collections never lazy load: callers must selectinload() what they use,
+    # and deletes rely on the ON DELETE CASCADE foreign keys instead of loading them
     objectives: Mapped[List["CampaignObjective"]] = relationship(
         "CampaignObjective",
         back_populates="campaign",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     templates: Mapped[List["EmailTemplate"]] = relationship(
         "EmailTemplate",
         back_populates="campaign",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     recipients: Mapped[List["CampaignRecipient"]] = relationship(
         "CampaignRecipient",
         back_populates="campaign",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     analytics: Mapped[Optional["CampaignAnalytics"]] = relationship(
         "CampaignAnalytics",
         back_populates="campaign",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     ai_generation_jobs: Mapped[List["AIGenerationJob"]] = relationship(
         "AIGenerationJob",
         back_populates="campaign",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
-        return f"<Campaign(id={self.id}, name='{self.name}', status='{self.status.value}')>"
+        return f"<Campaign(id={self.id}, name='{self.name}', status='{self.status}')>"
+    
+    @validates("status")
+    def _validate_status(self, key: str, value: str) -> str:
+        """Accept a CampaignStatus or its string value, store the plain value"""
+        return CampaignStatus(value).value
     
     @property
     def is_editable(self) -> bool:
         """Check if campaign can be edited"""
-        return self.status in [CampaignStatus.DRAFT, CampaignStatus.REVIEW, CampaignStatus.PAUSED]
+        return self.status in ("draft", "review", "paused")
     
     @property
     def is_sendable(self) -> bool:
         """Check if campaign is ready to be sent"""
-        return self.status in [CampaignStatus.SCHEDULED, CampaignStatus.PAUSED]
+        return self.status in ("scheduled", "paused")
 
 
 class CampaignObjective(Base, UUIDMixin, TimestampMixin):
@@ -218,6 +263,7 @@ class CampaignObjective(Base, UUIDMixin, TimestampMixin):
     priority: Mapped[int] = mapped_column(
         Integer,
         default=1,
+        server_default=text("1"),
         nullable=False,
         comment="Priority level (1 = highest)"
     )
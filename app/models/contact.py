@@ -1,9 +1,9 @@
 """
 Contact and recipient models
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Boolean, ARRAY, UniqueConstraint
+from sqlalchemy import Column, Computed, DDL, String, Integer, ForeignKey, DateTime, Text, Boolean, ARRAY, Index, UniqueConstraint, event, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from typing import Optional, List
 from datetime import datetime
 import uuid
@@ -27,6 +27,25 @@ class SendStatus(str):
     BOUNCED = "bounced"
 
 
+# Native PostgreSQL enum types for the status columns of the two largest
+# tables: 4 bytes per value instead of a varchar, in the heap and every index
+# containing them. Values map to plain strings, no Python-side coercion.
+SUBSCRIPTION_STATUS_ENUM = ENUM(
+    SubscriptionStatus.SUBSCRIBED,
+    SubscriptionStatus.UNSUBSCRIBED,
+    SubscriptionStatus.BOUNCED,
+    SubscriptionStatus.COMPLAINED,
+    name="subscription_status"
+)
+SEND_STATUS_ENUM = ENUM(
+    SendStatus.PENDING,
+    SendStatus.SENT,
+    SendStatus.FAILED,
+    SendStatus.BOUNCED,
+    name="send_status"
+)
+
+
 class ContactList(Base, UUIDMixin, TimestampMixin):
     """
     Contact list for organizing contacts
@@ -56,6 +75,7 @@ class ContactList(Base, UUIDMixin, TimestampMixin):
     total_contacts: Mapped[int] = mapped_column(
         Integer,
         default=0,
+        server_default=text("0"),
         nullable=False,
         comment="Total number of contacts in list"
     )
@@ -80,7 +100,9 @@ class ContactList(Base, UUIDMixin, TimestampMixin):
     list_members: Mapped[List["ContactListMember"]] = relationship(
         "ContactListMember",
         back_populates="contact_list",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
@@ -94,6 +116,37 @@ class Contact(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "contacts"
     __table_args__ = (
         UniqueConstraint('organization_id', 'email', name='uq_org_contact_email'),
+        # Contacts of an organization by subscription status;
+        # organization-only lookups use the unique constraint's prefix
+        Index('ix_contacts_org_status', 'organization_id', 'subscription_status'),
+        # Segmentation filters: tags.contains([...]) / tags.overlap([...]) and
+        # custom_fields.contains({...}) (@> containment) use these
+        Index('ix_contacts_tags_gin', 'tags', postgresql_using='gin'),
+        Index(
+            'ix_contacts_custom_fields_gin',
+            'custom_fields',
+            postgresql_using='gin',
+            postgresql_ops={'custom_fields': 'jsonb_path_ops'}
+        ),
+        # Substring name, email and company search (ILIKE '%...%'), requires pg_trgm
+        Index(
+            'ix_contacts_full_name_trgm',
+            'full_name',
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_contacts_email_trgm',
+            'email',
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_contacts_company_trgm',
+            'company',
+            postgresql_using='gin',
+            postgresql_ops={'company': 'gin_trgm_ops'}
+        ),
     )
 
     # Foreign Key
@@ -101,7 +154,6 @@ class Contact(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to organization"
     )
     
@@ -109,7 +161,6 @@ class Contact(Base, UUIDMixin, TimestampMixin):
     email: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
         comment="Contact email address"
     )
     first_name: Mapped[Optional[str]] = mapped_column(
@@ -132,6 +183,18 @@ class Contact(Base, UUIDMixin, TimestampMixin):
         nullable=True,
         comment="Job title"
     )
+    full_name: Mapped[str] = mapped_column(
+        String(255),
+        Computed(
+            "COALESCE("
+            "NULLIF(first_name, '') || ' ' || NULLIF(last_name, ''), "
+            "NULLIF(first_name, ''), "
+            "NULLIF(last_name, ''), "
+            "email)",
+            persisted=True
+        ),
+        comment="First and last name, falling back to email"
+    )
     
     # Segmentation
     tags: Mapped[Optional[List[str]]] = mapped_column(
@@ -147,15 +210,16 @@ class Contact(Base, UUIDMixin, TimestampMixin):
     
     # Subscription Status
     subscription_status: Mapped[str] = mapped_column(
-        String(50),
+        SUBSCRIPTION_STATUS_ENUM,
         default=SubscriptionStatus.SUBSCRIBED,
+        server_default=text("'subscribed'"),
         nullable=False,
-        index=True,
         comment="Subscription status"
     )
     email_verified: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
+        server_default=text("false"),
         nullable=False,
         comment="Whether email is verified"
     )
@@ -168,28 +232,31 @@ class Contact(Base, UUIDMixin, TimestampMixin):
     list_memberships: Mapped[List["ContactListMember"]] = relationship(
         "ContactListMember",
         back_populates="contact",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     campaign_recipients: Mapped[List["CampaignRecipient"]] = relationship(
         "CampaignRecipient",
         back_populates="contact",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
-    @property
-    def full_name(self) -> str:
-        """Get full name"""
-        parts = []
-        if self.first_name:
-            parts.append(self.first_name)
-        if self.last_name:
-            parts.append(self.last_name)
-        return " ".join(parts) if parts else self.email
-    
     def __repr__(self) -> str:
         return f"<Contact(id={self.id}, email='{self.email}', status='{self.subscription_status}')>"
 
 
+# Tables created via metadata.create_all (init_db) need pg_trgm for the
+# full_name trigram index
+event.listen(
+    Contact.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
 class ContactListMember(Base, UUIDMixin):
     """
     Junction table for many-to-many relationship between contacts and lists
@@ -226,11 +293,15 @@ class ContactListMember(Base, UUIDMixin):
     # Relationships
     contact: Mapped["Contact"] = relationship(
         "Contact",
-        back_populates="list_memberships"
+        back_populates="list_memberships",
+        lazy="joined",
+        innerjoin=True
     )
     contact_list: Mapped["ContactList"] = relationship(
         "ContactList",
-        back_populates="list_members"
+        back_populates="list_members",
+        lazy="joined",
+        innerjoin=True
     )
     
     def __repr__(self) -> str:
@@ -239,11 +310,21 @@ class ContactListMember(Base, UUIDMixin):
 
 class CampaignRecipient(Base, UUIDMixin):
     """
-    Track individual recipients for each campaign with engagement metrics
+    Track individual recipients for each campaign
+    
+    Open/click engagement is not updated in place; it is rolled up from the
+    append-only email_events into CampaignRecipientStats.
     """
     __tablename__ = "campaign_recipients"
     __table_args__ = (
         UniqueConstraint('campaign_id', 'contact_id', name='uq_campaign_contact'),
+        # Per-campaign send status counts as index-only scans
+        Index(
+            'ix_recipients_campaign_status',
+            'campaign_id',
+            'send_status',
+            postgresql_include=['sent_at']
+        ),
     )
 
     # Foreign Keys
@@ -251,9 +332,15 @@ class CampaignRecipient(Base, UUIDMixin):
         UUID(as_uuid=True),
         ForeignKey("campaigns.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to campaign"
     )
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Campaign's organization (denormalized for access checks)"
+    )
     contact_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("contacts.id", ondelete="CASCADE"),
@@ -264,10 +351,10 @@ class CampaignRecipient(Base, UUIDMixin):
     
     # Sending Status
     send_status: Mapped[str] = mapped_column(
-        String(50),
+        SEND_STATUS_ENUM,
         default=SendStatus.PENDING,
+        server_default=text("'pending'"),
         nullable=False,
-        index=True,
         comment="Send status: pending, sent, failed, bounced"
     )
     sent_at: Mapped[Optional[datetime]] = mapped_column(
@@ -276,60 +363,11 @@ class CampaignRecipient(Base, UUIDMixin):
         comment="When email was sent"
     )
     
-    # Open Tracking
-    opened: Mapped[bool] = mapped_column(
-        Boolean,
-        default=False,
-        nullable=False,
-        index=True,
-        comment="Whether email was opened"
-    )
-    open_count: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-        comment="Number of times opened"
-    )
-    first_opened_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        comment="First open timestamp"
-    )
-    last_opened_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        comment="Last open timestamp"
-    )
-    
-    # Click Tracking
-    clicked: Mapped[bool] = mapped_column(
-        Boolean,
-        default=False,
-        nullable=False,
-        index=True,
-        comment="Whether any link was clicked"
-    )
-    click_count: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-        comment="Number of clicks"
-    )
-    first_clicked_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        comment="First click timestamp"
-    )
-    last_clicked_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        comment="Last click timestamp"
-    )
-    
     # Unsubscribe Tracking
     unsubscribed: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
+        server_default=text("false"),
         nullable=False,
         comment="Whether recipient unsubscribed"
     )
@@ -358,7 +396,17 @@ class CampaignRecipient(Base, UUIDMixin):
     events: Mapped[List["EmailEvent"]] = relationship(
         "EmailEvent",
         back_populates="recipient",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
+    )
+    stats: Mapped[Optional["CampaignRecipientStats"]] = relationship(
+        "CampaignRecipientStats",
+        back_populates="recipient",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 """
 Organization and Company Profile models
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey, Text, ARRAY
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, ARRAY, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from typing import Optional, List
@@ -45,12 +45,14 @@ class Organization(Base, UUIDMixin, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(
         Boolean, 
         default=True, 
+        server_default=text("true"), 
         nullable=False,
         comment="Whether organization is active"
     )
     subscription_tier: Mapped[str] = mapped_column(
         String(50), 
         default="beta", 
+        server_default=text("'beta'"), 
         nullable=False,
         comment="Subscription tier: beta, starter, pro, enterprise"
     )
@@ -66,33 +68,45 @@ class Organization(Base, UUIDMixin, TimestampMixin):
     users: Mapped[List["User"]] = relationship(
         "User", 
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     company_profile: Mapped[Optional["CompanyProfile"]] = relationship(
         "CompanyProfile",
         back_populates="organization",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     campaigns: Mapped[List["Campaign"]] = relationship(
         "Campaign",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     contacts: Mapped[List["Contact"]] = relationship(
         "Contact",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     contact_lists: Mapped[List["ContactList"]] = relationship(
         "ContactList",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     audit_logs: Mapped[List["AuditLog"]] = relationship(
         "AuditLog",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
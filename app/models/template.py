@@ -1,15 +1,17 @@
 """
 Email template and AI generation models
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Boolean, UniqueConstraint
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Boolean, UniqueConstraint, Index, text, Enum as SQLEnum
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from typing import Optional, List
 from datetime import datetime
 import uuid
 import enum
 
-from .base import Base, TimestampMixin, UUIDMixin
+from .base import Base, TimestampMixin, UUIDMixin, enum_check
+# Job statuses are defined once, with the API schemas
+from schemas.ai_generation import AIJobStatus
 
 
 class TemplateStatus(str, enum.Enum):
@@ -36,6 +38,16 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "email_templates"
     __table_args__ = (
         UniqueConstraint('campaign_id', 'version', name='uq_campaign_version'),
+        enum_check('status', TemplateStatus, 'ck_email_templates_status'),
+        enum_check('generated_by', GeneratedBy, 'ck_email_templates_generated_by'),
+        # Current template lookup; also allows at most one current version
+        # per campaign
+        Index(
+            'ix_templates_current_by_campaign',
+            'campaign_id',
+            unique=True,
+            postgresql_where=text('is_current')
+        ),
     )
 
     # Foreign Key
@@ -46,6 +58,13 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
         index=True,
         comment="Reference to campaign"
     )
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Campaign's organization (denormalized for access checks)"
+    )
     
     # Version Control
     version: Mapped[int] = mapped_column(
@@ -56,8 +75,8 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     is_current: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
+        server_default=text("false"),
         nullable=False,
-        index=True,
         comment="Whether this is the current active version"
     )
     
@@ -89,14 +108,20 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     )
     
     # Email Content
+    # Deferred: metadata queries (version lookups) skip the payload; readers
+    # of the body add undefer_group("content")
     html_content: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="content",
         comment="HTML email content"
     )
     plain_text_content: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="content",
         comment="Plain text email content"
     )
     
@@ -104,6 +129,7 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     generated_by: Mapped[str] = mapped_column(
         String(50),
         default=GeneratedBy.AI.value,
+        server_default=text("'ai'"),
         nullable=False,
         comment="Content generation source: ai, human, hybrid"
     )
@@ -127,6 +153,7 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     status: Mapped[TemplateStatus] = mapped_column(
         String(50),
         default=TemplateStatus.DRAFT.value,
+        server_default=text("'draft'"),
         nullable=False,
         index=True,
         comment="Template status"
@@ -174,11 +201,23 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     revisions: Mapped[List["EmailRevision"]] = relationship(
         "EmailRevision",
         back_populates="template",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
         return f"<EmailTemplate(id={self.id}, campaign_id={self.campaign_id}, version={self.version}, current={self.is_current})>"
+    
+    @validates("status")
+    def _validate_status(self, key: str, value: str) -> str:
+        """Accept a TemplateStatus or its string value, store the plain value"""
+        return TemplateStatus(value).value
+    
+    @validates("generated_by")
+    def _validate_generated_by(self, key: str, value: str) -> str:
+        """Accept a GeneratedBy or its string value, store the plain value"""
+        return GeneratedBy(value).value
 
 
 class EmailRevision(Base, UUIDMixin, TimestampMixin):
@@ -241,13 +280,27 @@ class AIGenerationJob(Base, UUIDMixin, TimestampMixin):
     Track AI generation jobs for async processing
     """
     __tablename__ = "ai_generation_jobs"
+    __table_args__ = (
+        enum_check('status', AIJobStatus, 'ck_ai_generation_jobs_status'),
+        # Serves the newest-first keyset listing per campaign; status/job_type
+        # are included so filtered pages can be answered from the index
+        Index(
+            'ix_aijob_campaign_created',
+            'campaign_id',
+            text('created_at DESC'),
+            text('id DESC'),
+            postgresql_include=['status', 'job_type']
+        ),
+    )
+    # Fetch server defaults (created_at/updated_at) via INSERT/UPDATE ... RETURNING
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Foreign Keys
     campaign_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("campaigns.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to campaign"
     )
     template_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -263,12 +316,21 @@ class AIGenerationJob(Base, UUIDMixin, TimestampMixin):
         nullable=False,
         comment="Type: initial_generation, revision, ab_variant, subject_line_test"
     )
-    status: Mapped[str] = mapped_column(
-        String(50),
-        default="pending",
+    status: Mapped[AIJobStatus] = mapped_column(
+        # Stored by value (lowercase) in the existing VARCHAR(50) column
+        SQLEnum(
+            AIJobStatus,
+            native_enum=False,
+            length=50,
+            values_callable=lambda statuses: [s.value for s in statuses],
+            # Reject unknown plain strings too, not just non-members
+            validate_strings=True
+        ),
+        default=AIJobStatus.PENDING,
+        server_default=text("'pending'"),
         nullable=False,
         index=True,
-        comment="Status: pending, processing, completed, failed"
+        comment="Status: pending, processing, completed, failed, cancelled"
     )
     
     # Input
@@ -277,9 +339,13 @@ class AIGenerationJob(Base, UUIDMixin, TimestampMixin):
         nullable=True,
         comment="User's generation prompt"
     )
+    # Deferred: only the job processors read it, so status polling and job
+    # listings skip it; processors add undefer_group("content")
     context: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
+        deferred_group="content",
         comment="Generation context: company profile, campaign objectives"
     )
     
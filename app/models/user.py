@@ -1,7 +1,7 @@
 """
 User model for authentication and authorization
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from typing import Optional, List
@@ -11,6 +11,15 @@ import uuid
 from .base import Base, TimestampMixin, UUIDMixin
 
 
+# Permissions granted by each role ("all" grants every permission)
+ROLE_PERMISSIONS = {
+    "owner": frozenset({"all"}),
+    "admin": frozenset({"create", "read", "update", "delete", "approve"}),
+    "member": frozenset({"create", "read", "update"}),
+    "viewer": frozenset({"read"}),
+}
+
+
 class User(Base, UUIDMixin, TimestampMixin):
     """
     User model for platform access
@@ -50,12 +59,14 @@ class User(Base, UUIDMixin, TimestampMixin):
     role: Mapped[str] = mapped_column(
         String(50),
         default="member",
+        server_default=text("'member'"),
         nullable=False,
         comment="User role: owner, admin, member, viewer"
     )
     is_active: Mapped[bool] = mapped_column(
         Boolean,
         default=True,
+        server_default=text("true"),
         nullable=False,
         comment="Whether user account is active"
     )
@@ -82,25 +93,35 @@ class User(Base, UUIDMixin, TimestampMixin):
     campaigns_created: Mapped[List["Campaign"]] = relationship(
         "Campaign",
         back_populates="creator",
-        foreign_keys="Campaign.created_by"
+        foreign_keys="Campaign.created_by",
+        lazy="raise",
+        passive_deletes=True
     )
     templates_created: Mapped[List["EmailTemplate"]] = relationship(
         "EmailTemplate",
         back_populates="creator",
-        foreign_keys="EmailTemplate.created_by"
+        foreign_keys="EmailTemplate.created_by",
+        lazy="raise",
+        passive_deletes=True
     )
     templates_reviewed: Mapped[List["EmailTemplate"]] = relationship(
         "EmailTemplate",
         back_populates="reviewer",
-        foreign_keys="EmailTemplate.reviewed_by"
+        foreign_keys="EmailTemplate.reviewed_by",
+        lazy="raise",
+        passive_deletes=True
     )
     ai_generation_jobs: Mapped[List["AIGenerationJob"]] = relationship(
         "AIGenerationJob",
-        back_populates="creator"
+        back_populates="creator",
+        lazy="raise",
+        passive_deletes=True
     )
     contact_lists_created: Mapped[List["ContactList"]] = relationship(
         "ContactList",
-        back_populates="creator"
+        back_populates="creator",
+        lazy="raise",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
@@ -108,12 +129,5 @@ class User(Base, UUIDMixin, TimestampMixin):
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission based on role"""
-        role_permissions = {
-            "owner": ["all"],
-            "admin": ["create", "read", "update", "delete", "approve"],
-            "member": ["create", "read", "update"],
-            "viewer": ["read"]
-        }
-        
-        user_permissions = role_permissions.get(self.role, [])
+        user_permissions = ROLE_PERMISSIONS.get(self.role, frozenset())
         return "all" in user_permissions or permission in user_permissions
\ No newline at end of file
@@ -1,8 +1,8 @@
 #!/bin/bash
 
-# Start Celery worker for AI generation tasks
+# Start Celery worker for AI generation and maintenance tasks
 celery -A workers.celery_app worker \
     --loglevel=info \
-    --queues=ai_generation \
+    --queues=ai_generation,maintenance \
     --concurrency=2 \
     --pool=solo
\ No newline at end of file
@@ -1,93 +1,85 @@
 """
 Pydantic schemas
+
+Re-exports are resolved lazily (PEP 562) so importing one submodule, e.g.
+schemas.auth in an auth-only process, does not build every other schema.
 """
-from .auth import (
-    UserRegister,
-    UserLogin,
-    TokenRefresh,
-    PasswordResetRequest,
-    PasswordReset,
-    PasswordChange,
-    UserResponse,
-    OrganizationResponse,
-    TokenResponse,
-    MessageResponse,
-    ErrorResponse,
-)
+import importlib
+
+
+# Submodule -> public names re-exported from it
+_EXPORTS = {
+    "auth": [
+        "UserRegister",
+        "UserLogin",
+        "TokenRefresh",
+        "PasswordResetRequest",
+        "PasswordReset",
+        "PasswordChange",
+        "UserResponse",
+        "OrganizationResponse",
+        "TokenResponse",
+        "MessageResponse",
+        "ErrorResponse",
+    ],
+    "campaign": [
+        "CampaignStatusEnum",
+        "CampaignGoalEnum",
+        "ObjectiveTypeEnum",
+        "KPINameEnum",
+        "CampaignObjectiveCreate",
+        "CampaignObjectiveUpdate",
+        "CampaignObjectiveResponse",
+        "CampaignCreate",
+        "CampaignUpdate",
+        "CampaignResponse",
+        "CampaignListResponse",
+        "CampaignScheduleRequest",
+        "CampaignStatsResponse",
+    ],
+    "ai_generation": [
+        "AIJobStatus",
+        "AIJobType",
+        "ToneEnum",
+        "LengthEnum",
+        "PersonalizationLevel",
+        "AIGenerationOptions",
+        "AIGenerationRequest",
+        "AIRefinementRequest",
+        "SubjectLineVariantsRequest",
+        "EmailVariant",
+        "AIGenerationResponse",
+        "SubjectLineVariant",
+        "SubjectLineVariantsResponse",
+        "AIGenerationJobList",
+    ],
+}
+
+_NAME_TO_MODULE = {
+    name: module
+    for module, names in _EXPORTS.items()
+    for name in names
+}
 
-from .campaign import (
-    CampaignStatusEnum,
-    CampaignGoalEnum,
-    ObjectiveTypeEnum,
-    KPINameEnum,
-    CampaignObjectiveCreate,
-    CampaignObjectiveUpdate,
-    CampaignObjectiveResponse,
-    CampaignCreate,
-    CampaignUpdate,
-    CampaignResponse,
-    CampaignListResponse,
-    CampaignScheduleRequest,
-    CampaignStatsResponse,
-)
+__all__ = list(_NAME_TO_MODULE)
 
-from .ai_generation import (
-    AIJobStatus,
-    AIJobType,
-    ToneEnum,
-    LengthEnum,
-    PersonalizationLevel,
-    AIGenerationOptions,
-    AIGenerationRequest,
-    AIRefinementRequest,
-    SubjectLineVariantsRequest,
-    EmailVariant,
-    AIGenerationResponse,
-    SubjectLineVariant,
-    SubjectLineVariantsResponse,
-    AIGenerationJobList,
-)
 
-__all__ = [
-    # Auth
-    "UserRegister",
-    "UserLogin",
-    "TokenRefresh",
-    "PasswordResetRequest",
-    "PasswordReset",
-    "PasswordChange",
-    "UserResponse",
-    "OrganizationResponse",
-    "TokenResponse",
-    "MessageResponse",
-    "ErrorResponse",
-    # Campaign
-    "CampaignStatusEnum",
-    "CampaignGoalEnum",
-    "ObjectiveTypeEnum",
-    "KPINameEnum",
-    "CampaignObjectiveCreate",
-    "CampaignObjectiveUpdate",
-    "CampaignObjectiveResponse",
-    "CampaignCreate",
-    "CampaignUpdate",
-    "CampaignResponse",
-    "CampaignListResponse",
-    "CampaignScheduleRequest",
-    "CampaignStatsResponse",
-    # AI Generation
-    "AIJobStatus",
-    "AIJobType",
-    "ToneEnum",
-    "LengthEnum",
-    "PersonalizationLevel",
-    "AIGenerationOptions",
-    "AIGenerationRequest",
-    "AIRefinementRequest",
-    "SubjectLineVariantsRequest",
-    "EmailVariant",
-    "AIGenerationResponse",
-    "SubjectLineVariant",
-    "SubjectLineVariantsResponse",
-    "AIGenerationJobList",
-]
\ No newline at end of file
+def __getattr__(name: str):
+    """
+    Import the defining submodule on first access to a re-exported name
+    
+    Args:
+        name: Attribute requested from the package
+        
+    Returns:
+        The schema class or enum
+        
+    Raises:
+        AttributeError: If the name is not re-exported here
+    """
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,7 @@
 """
 AI Generation schemas for email content creation
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -103,8 +103,8 @@ class AIGenerationOptions(BaseModel):
         description="Specific areas to focus on (e.g., 'cost savings', 'compliance')"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "tone": "professional",
                 "length": "medium",
@@ -116,7 +116,9 @@ class AIGenerationOptions(BaseModel):
                 "temperature": 0.7,
                 "focus_areas": ["cost savings", "compliance", "efficiency"]
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 # ============================================
@@ -140,8 +142,8 @@ class AIGenerationRequest(BaseModel):
         description="Additional context to override or supplement"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_prompt": "Create an email announcing our new AI-powered clinical documentation platform. Focus on how it reduces FDA submission preparation time by 60%. Target audience is clinical research managers at pharmaceutical companies.",
                 "generation_options": {
@@ -156,7 +158,9 @@ class AIGenerationRequest(BaseModel):
                     "additional_context": "Emphasize compliance and security features"
                 }
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class AIRefinementRequest(BaseModel):
@@ -177,8 +181,8 @@ class AIRefinementRequest(BaseModel):
     )
     generation_options: Optional[AIGenerationOptions] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "template_id": "550e8400-e29b-41d4-a716-446655440000",
                 "refinement_instructions": "Make the tone more urgent, add social proof with a customer testimonial, and strengthen the CTA",
@@ -188,7 +192,9 @@ class AIRefinementRequest(BaseModel):
                     "temperature": 0.8
                 }
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class SubjectLineVariantsRequest(BaseModel):
@@ -212,20 +218,34 @@ class SubjectLineVariantsRequest(BaseModel):
         description="Style preference (e.g., 'question', 'benefit-driven', 'curiosity')"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "template_id": "550e8400-e29b-41d4-a716-446655440000",
                 "count": 5,
                 "style": "benefit-driven"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 # ============================================
 # GENERATION RESPONSES
 # ============================================
 
+# Shared by EmailVariant and the variants in AIGenerationResponse
+_EMAIL_VARIANT_EXAMPLE = {
+    "variant_id": 1,
+    "subject_line": "Transform Your FDA Submissions: 60% Faster Documentation",
+    "preview_text": "AI-powered clinical documentation that regulatory teams trust",
+    "html_content": "<html>...</html>",
+    "plain_text_content": "Plain text version...",
+    "confidence_score": 0.92,
+    "reasoning": "This variant emphasizes the key benefit (60% faster) and builds trust"
+}
+
+
 class EmailVariant(BaseModel):
     """Single email content variant"""
     variant_id: int = Field(..., description="Variant number")
@@ -244,18 +264,10 @@ class EmailVariant(BaseModel):
         description="AI reasoning for this variant"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "variant_id": 1,
-                "subject_line": "Transform Your FDA Submissions: 60% Faster Documentation",
-                "preview_text": "AI-powered clinical documentation that regulatory teams trust",
-                "html_content": "<html>...</html>",
-                "plain_text_content": "Plain text version...",
-                "confidence_score": 0.92,
-                "reasoning": "This variant emphasizes the key benefit (60% faster) and builds trust"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _EMAIL_VARIANT_EXAMPLE},
+        defer_build=True
+    )
 
 
 class AIGenerationResponse(BaseModel):
@@ -279,32 +291,26 @@ class AIGenerationResponse(BaseModel):
     started_at: Optional[datetime] = Field(None, description="Job start time")
     completed_at: Optional[datetime] = Field(None, description="Job completion time")
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "job_id": "550e8400-e29b-41d4-a716-446655440000",
                 "campaign_id": "660e8400-e29b-41d4-a716-446655440001",
                 "status": "completed",
                 "job_type": "initial_generation",
                 "generated_content": {
-                    "variants": [
-                        {
-                            "variant_id": 1,
-                            "subject_line": "Transform Your FDA Submissions",
-                            "preview_text": "AI-powered clinical documentation",
-                            "html_content": "<html>...</html>",
-                            "plain_text_content": "Plain text...",
-                            "confidence_score": 0.92
-                        }
-                    ]
+                    "variants": [_EMAIL_VARIANT_EXAMPLE]
                 },
                 "ai_model": "claude-sonnet-4-5",
                 "tokens_used": 2450,
                 "created_at": "2024-12-28T10:00:00Z",
                 "completed_at": "2024-12-28T10:00:30Z"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class SubjectLineVariant(BaseModel):
@@ -322,8 +328,9 @@ class SubjectLineVariantsResponse(BaseModel):
     id: UUID
     status: AIJobStatus
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "job_id": "550e8400-e29b-41d4-a716-446655440000",
                 "status": "completed",
@@ -337,13 +344,17 @@ class SubjectLineVariantsResponse(BaseModel):
                     }
                 ]
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class AIGenerationJobList(BaseModel):
-    """List of AI generation jobs"""
+    """Cursor-paginated list of AI generation jobs"""
     jobs: List[AIGenerationResponse]
-    total: int
-    page: int
     per_page: int
-    pages: int
\ No newline at end of file
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (null on the last page)"
+    )
+    has_more: bool = Field(False, description="Whether more jobs are available")
\ No newline at end of file
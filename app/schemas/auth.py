@@ -1,39 +1,83 @@
 """
 Authentication schemas for request/response validation
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, Field, validator, field_validator, ConfigDict
+from pydantic.networks import validate_email
 from typing import Optional
 from datetime import datetime
 import re
 
 
+# Compiled once; the password validators run on every register/reset/change
+_HAS_UPPER = re.compile(r'[A-Z]').search
+_HAS_LOWER = re.compile(r'[a-z]').search
+_HAS_DIGIT = re.compile(r'\d').search
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Shared password strength rules for the password validators
+    
+    Args:
+        v: Candidate password
+        
+    Returns:
+        The password, unchanged
+        
+    Raises:
+        ValueError: If the password is too short or lacks an uppercase
+            letter, a lowercase letter or a digit
+    """
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    if not _HAS_UPPER(v):
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not _HAS_LOWER(v):
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not _HAS_DIGIT(v):
+        raise ValueError('Password must contain at least one digit')
+    return v
+
+
+def _validate_email_address(v: str) -> str:
+    """
+    Validate an email address the way EmailStr does
+    
+    EmailStr builds its validator when the schema class is created, which
+    imports email-validator (and dnspython) in every process that loads these
+    schemas; pydantic's validate_email imports it on first use instead.
+    
+    Args:
+        v: Candidate email address
+        
+    Returns:
+        Normalized email address
+    """
+    return validate_email(v)[1]
+
+
 # ============================================
 # REQUEST SCHEMAS
 # ============================================
 
 class UserRegister(BaseModel):
     """Schema for user registration"""
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address", json_schema_extra={"format": "email"})
     password: str = Field(..., min_length=8, max_length=100, description="User password")
     full_name: str = Field(..., min_length=2, max_length=255, description="Full name")
     organization_name: str = Field(..., min_length=2, max_length=255, description="Organization name")
     industry: Optional[str] = Field(None, max_length=100, description="Industry vertical")
     
-    @validator('password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    @validator('email')
+    def validate_email(cls, v):
+        """Validate and normalize the email address"""
+        return _validate_email_address(v)
+    
+    # Registered directly so pydantic calls the shared check without a wrapper
+    validate_password = field_validator('password')(staticmethod(_validate_password_strength))
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "vikash@techcorp.com",
                 "password": "SecurePass123!",
@@ -41,45 +85,63 @@ class UserRegister(BaseModel):
                 "organization_name": "TechCorp Inc",
                 "industry": "pharmaceutical"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class UserLogin(BaseModel):
     """Schema for user login"""
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address", json_schema_extra={"format": "email"})
     password: str = Field(..., description="User password")
     
-    class Config:
-        json_schema_extra = {
+    @validator('email')
+    def validate_email(cls, v):
+        """Validate and normalize the email address"""
+        return _validate_email_address(v)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "vikash@techcorp.com",
                 "password": "SecurePass123!"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class TokenRefresh(BaseModel):
     """Schema for token refresh"""
     refresh_token: str = Field(..., description="Refresh token")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGc..."
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class PasswordResetRequest(BaseModel):
     """Schema for requesting password reset"""
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address", json_schema_extra={"format": "email"})
+    
+    @validator('email')
+    def validate_email(cls, v):
+        """Validate and normalize the email address"""
+        return _validate_email_address(v)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "vikash@techcorp.com"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class PasswordReset(BaseModel):
@@ -87,26 +149,17 @@ class PasswordReset(BaseModel):
     token: str = Field(..., description="Password reset token")
     new_password: str = Field(..., min_length=8, max_length=100, description="New password")
     
-    @validator('new_password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    validate_password = field_validator('new_password')(staticmethod(_validate_password_strength))
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "token": "reset-token-here",
                 "new_password": "NewSecurePass123!"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class PasswordChange(BaseModel):
@@ -114,18 +167,7 @@ class PasswordChange(BaseModel):
     current_password: str = Field(..., description="Current password")
     new_password: str = Field(..., min_length=8, max_length=100, description="New password")
     
-    @validator('new_password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+    validate_password = field_validator('new_password')(staticmethod(_validate_password_strength))
 
 
 # ============================================
@@ -136,6 +178,18 @@ from uuid import UUID
 
 # ...
 
+# Shared by UserResponse and the user nested in TokenResponse
+_USER_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "email": "vikash@techcorp.com",
+    "full_name": "Vikash Kumar",
+    "role": "owner",
+    "organization_id": "660e8400-e29b-41d4-a716-446655440000",
+    "is_active": True,
+    "created_at": "2024-12-28T10:00:00Z",
+    "last_login": "2024-12-29T09:30:00Z"
+}
+
 class UserResponse(BaseModel):
     """Schema for user data in responses"""
     id: UUID
@@ -147,20 +201,27 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login: Optional[datetime]
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "email": "vikash@techcorp.com",
-                "full_name": "Vikash Kumar",
-                "role": "owner",
-                "organization_id": "660e8400-e29b-41d4-a716-446655440000",
-                "is_active": True,
-                "created_at": "2024-12-28T10:00:00Z",
-                "last_login": "2024-12-29T09:30:00Z"
-            }
-        }
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "UserResponse":
+        """
+        Build from an ORM row without running validation
+        
+        Only for rows loaded from our own database, whose column types
+        already match the fields; use model_validate for anything else.
+        
+        Args:
+            obj: User row
+            
+        Returns:
+            UserResponse with every field set
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={"example": _USER_EXAMPLE},
+        defer_build=True
+    )
 
 
 class OrganizationResponse(BaseModel):
@@ -172,8 +233,26 @@ class OrganizationResponse(BaseModel):
     subscription_tier: str
     is_active: bool
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "OrganizationResponse":
+        """
+        Build from an ORM row without running validation
+        
+        Only for rows loaded from our own database, whose column types
+        already match the fields; use model_validate for anything else.
+        
+        Args:
+            obj: Organization row
+            
+        Returns:
+            OrganizationResponse with every field set
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True
+    )
 
 
 class TokenResponse(BaseModel):
@@ -184,37 +263,32 @@ class TokenResponse(BaseModel):
     expires_in: int
     user: UserResponse
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJ0eXAiOiJKV1QiLCJhbGc...",
                 "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGc...",
                 "token_type": "bearer",
                 "expires_in": 1800,
-                "user": {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "email": "vikash@techcorp.com",
-                    "full_name": "Vikash Kumar",
-                    "role": "owner",
-                    "organization_id": "660e8400-e29b-41d4-a716-446655440000",
-                    "is_active": True,
-                    "created_at": "2024-12-28T10:00:00Z",
-                    "last_login": None
-                }
+                "user": _USER_EXAMPLE
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class MessageResponse(BaseModel):
     """Generic message response"""
     message: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "Operation successful"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -222,10 +296,12 @@ class ErrorResponse(BaseModel):
     detail: str
     error_code: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "detail": "Invalid credentials",
                 "error_code": "INVALID_CREDENTIALS"
             }
-        }
\ No newline at end of file
+        },
+        defer_build=True
+    )
\ No newline at end of file
@@ -1,8 +1,8 @@
 """
 Campaign schemas for request/response validation
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, validator, ConfigDict
+from typing import Optional, List, Literal
 from datetime import datetime
 from enum import Enum
 from uuid import UUID
@@ -47,6 +47,11 @@ class KPINameEnum(str, Enum):
     ENGAGEMENT = "engagement"
 
 
+# Campaign list sort options (Literal so validation is a set lookup, not a regex)
+CampaignSortField = Literal["created_at", "updated_at", "name", "scheduled_at"]
+SortOrder = Literal["asc", "desc"]
+
+
 # ============================================
 # OBJECTIVE SCHEMAS
 # ============================================
@@ -63,8 +68,8 @@ class CampaignObjectiveBase(BaseModel):
 class CampaignObjectiveCreate(CampaignObjectiveBase):
     """Schema for creating campaign objective"""
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "objective_type": "primary",
                 "description": "Generate qualified demo requests",
@@ -72,7 +77,9 @@ class CampaignObjectiveCreate(CampaignObjectiveBase):
                 "target_value": 5.0,
                 "priority": 1
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignObjectiveUpdate(BaseModel):
@@ -83,13 +90,15 @@ class CampaignObjectiveUpdate(BaseModel):
     target_value: Optional[float] = Field(None, ge=0)
     priority: Optional[int] = Field(None, ge=1, le=10)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "target_value": 7.0,
                 "priority": 1
             }
-        }
+        },
+        defer_build=True
+    )
 
 class CampaignObjectiveResponse(CampaignObjectiveBase):
     """Schema for campaign objective response"""
@@ -97,9 +106,10 @@ class CampaignObjectiveResponse(CampaignObjectiveBase):
     campaign_id: UUID
     created_at: datetime
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "campaign_id": "660e8400-e29b-41d4-a716-446655440001",
@@ -110,7 +120,9 @@ class CampaignObjectiveResponse(CampaignObjectiveBase):
                 "priority": 1,
                 "created_at": "2024-12-28T10:00:00Z"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 # ============================================
@@ -132,8 +144,8 @@ class CampaignCreate(CampaignBase):
     target_metrics: Optional[dict] = Field(None, description="Target metrics")
     scheduled_at: Optional[datetime] = Field(None, description="Schedule send time")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Q1 Product Launch - AI Documentation Suite",
                 "description": "Introducing our new AI-powered clinical documentation platform",
@@ -163,7 +175,9 @@ class CampaignCreate(CampaignBase):
                 },
                 "scheduled_at": "2025-01-15T09:00:00Z"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignUpdate(BaseModel):
@@ -176,8 +190,8 @@ class CampaignUpdate(BaseModel):
     target_metrics: Optional[dict] = None
     scheduled_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Q1 Product Launch - Updated",
                 "target_metrics": {
@@ -185,7 +199,9 @@ class CampaignUpdate(BaseModel):
                     "click_rate": 12.0
                 }
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignResponse(CampaignBase):
@@ -204,9 +220,10 @@ class CampaignResponse(CampaignBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "660e8400-e29b-41d4-a716-446655440001",
                 "organization_id": "770e8400-e29b-41d4-a716-446655440002",
@@ -230,27 +247,36 @@ class CampaignResponse(CampaignBase):
                 "created_at": "2024-12-28T10:00:00Z",
                 "updated_at": "2024-12-28T10:00:00Z"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignListResponse(BaseModel):
     """Schema for paginated campaign list"""
     campaigns: List[CampaignResponse]
-    total: int = Field(..., description="Total number of campaigns")
-    page: int = Field(..., description="Current page number")
+    total: Optional[int] = Field(..., description="Total number of campaigns (null for cursor requests)")
+    page: Optional[int] = Field(..., description="Current page number (null for cursor requests)")
     per_page: int = Field(..., description="Items per page")
-    pages: int = Field(..., description="Total number of pages")
+    pages: Optional[int] = Field(..., description="Total number of pages (null for cursor requests)")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as `after` to fetch the next page (created_at sort only)"
+    )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "campaigns": [],
                 "total": 45,
                 "page": 1,
                 "per_page": 20,
-                "pages": 3
+                "pages": 3,
+                "next_cursor": "MjAyNC0xMi0yOFQxMDowMDowMCswMDowMHw2NjBlODQwMC1lMjliLTQxZDQtYTcxNi00NDY2NTU0NDAwMDE="
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignScheduleRequest(BaseModel):
@@ -264,12 +290,14 @@ class CampaignScheduleRequest(BaseModel):
             raise ValueError('Scheduled time must be in the future')
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "scheduled_at": "2025-01-15T09:00:00Z"
             }
-        }
+        },
+        defer_build=True
+    )
 
 
 class CampaignStatsResponse(BaseModel):
@@ -281,8 +309,8 @@ class CampaignStatsResponse(BaseModel):
     active: int
     archived: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_campaigns": 45,
                 "draft": 12,
@@ -291,4 +319,6 @@ class CampaignStatsResponse(BaseModel):
                 "active": 3,
                 "archived": 0
             }
-        }
\ No newline at end of file
+        },
+        defer_build=True
+    )
\ No newline at end of file
@@ -3,6 +3,7 @@ Service layer
 """
 from .auth_service import AuthService
 from .campaign_service import CampaignService
+from .contact_service import ContactService
 from .ai_generation_service import AIGenerationService
 
-__all__ = ["AuthService", "CampaignService", "AIGenerationService"]
+__all__ = ["AuthService", "CampaignService", "ContactService", "AIGenerationService"]
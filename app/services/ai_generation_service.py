@@ -2,12 +2,13 @@
 AI Generation service using Anthropic Claude
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, and_, tuple_
+from sqlalchemy.orm import selectinload, undefer_group
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import uuid
 import json
+import hashlib
 import anthropic
 from anthropic import AsyncAnthropic
 
@@ -29,7 +30,41 @@ from utils.prompts import (
     build_subject_line_prompt,
     build_optimization_prompt,
 )
+from utils.pagination import encode_cursor, decode_cursor
 from core.config import settings
+from core.cache import publish_job_event
+
+
+# Identical generation requests for a campaign within this window share one job
+GENERATION_IDEMPOTENCY_TTL = 60
+
+
+def generation_idempotency_key(
+    campaign_id: uuid.UUID,
+    generation_request: AIGenerationRequest,
+    client_key: Optional[str] = None
+) -> str:
+    """
+    Build the Redis key used to deduplicate generation submissions
+    
+    Args:
+        campaign_id: Campaign UUID
+        generation_request: Generation request data
+        client_key: Client-supplied Idempotency-Key header, if any
+        
+    Returns:
+        Redis key; derived from the client key when given, otherwise from the
+        prompt, options and context override
+    """
+    if client_key:
+        fingerprint = client_key
+    else:
+        fingerprint = json.dumps(
+            generation_request.model_dump(mode="json"),
+            sort_keys=True
+        )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+    return f"aigen:idemp:{campaign_id}:{digest}"
 
 
 class AIGenerationService:
@@ -46,7 +81,8 @@ class AIGenerationService:
         organization_id: uuid.UUID,
         user_id: uuid.UUID,
         generation_request: AIGenerationRequest,
-        job_type: AIJobType = AIJobType.INITIAL_GENERATION
+        job_type: AIJobType = AIJobType.INITIAL_GENERATION,
+        job_id: Optional[uuid.UUID] = None
     ) -> AIGenerationJob:
         """
         Create a new AI generation job
@@ -57,9 +93,10 @@ class AIGenerationService:
             user_id: User UUID creating the job
             generation_request: Generation request data
             job_type: Type of generation job
+            job_id: Pre-allocated job UUID (generated when omitted)
             
         Returns:
-            Created AI generation job
+            Created AI generation job (flushed, not committed; the caller commits)
         """
         # Get campaign with objectives
         stmt = (
@@ -121,7 +158,7 @@ class AIGenerationService:
         
         # Create job
         job = AIGenerationJob(
-            id=uuid.uuid4(),
+            id=job_id or uuid.uuid4(),
             campaign_id=campaign_id,
             job_type=job_type.value,
             status=AIJobStatus.PENDING.value,
@@ -131,8 +168,7 @@ class AIGenerationService:
         )
         
         self.db.add(job)
-        await self.db.commit()
-        await self.db.refresh(job)
+        await self.db.flush()
         
         return job
     
@@ -150,7 +186,9 @@ class AIGenerationService:
             Updated job with results
         """
         # Get job
-        stmt = select(AIGenerationJob).where(AIGenerationJob.id == job_id)
+        stmt = select(AIGenerationJob).where(
+            AIGenerationJob.id == job_id
+        ).options(undefer_group("content"))
         result = await self.db.execute(stmt)
         job = result.scalar_one_or_none()
         
@@ -275,7 +313,7 @@ class AIGenerationService:
                 AIGenerationJob.id == job_id,
                 AIGenerationJob.campaign_id == campaign_id
             )
-        )
+        ).options(undefer_group("content"))
         result = await self.db.execute(stmt)
         job = result.scalar_one_or_none()
         
@@ -302,6 +340,7 @@ class AIGenerationService:
         template = EmailTemplate(
             id=uuid.uuid4(),
             campaign_id=campaign_id,
+            organization_id=organization_id,
             version=new_version,
             is_current=False,  # Don't set as current automatically
             subject_line=variant['subject_line'],
@@ -359,9 +398,10 @@ class AIGenerationService:
         stmt = select(EmailTemplate).where(
             and_(
                 EmailTemplate.id == template_id,
-                EmailTemplate.campaign_id == campaign_id
+                EmailTemplate.campaign_id == campaign_id,
+                EmailTemplate.organization_id == organization_id
             )
-        )
+        ).options(undefer_group("content"))
         result = await self.db.execute(stmt)
         template = result.scalar_one_or_none()
         
@@ -396,7 +436,6 @@ class AIGenerationService:
         
         self.db.add(job)
         await self.db.commit()
-        await self.db.refresh(job)
         
         return job
     
@@ -414,7 +453,9 @@ class AIGenerationService:
             Updated job with results
         """
         # Get job
-        stmt = select(AIGenerationJob).where(AIGenerationJob.id == job_id)
+        stmt = select(AIGenerationJob).where(
+            AIGenerationJob.id == job_id
+        ).options(undefer_group("content"))
         result = await self.db.execute(stmt)
         job = result.scalar_one_or_none()
         
@@ -517,7 +558,12 @@ class AIGenerationService:
         email_content = None
         if request_data.template_id:
             template_uuid = uuid.UUID(request_data.template_id)
-            stmt = select(EmailTemplate).where(EmailTemplate.id == template_uuid)
+            stmt = select(EmailTemplate).where(
+                and_(
+                    EmailTemplate.id == template_uuid,
+                    EmailTemplate.organization_id == organization_id
+                )
+            ).options(undefer_group("content"))
             result = await self.db.execute(stmt)
             template = result.scalar_one_or_none()
             
@@ -564,7 +610,6 @@ class AIGenerationService:
         
         self.db.add(job)
         await self.db.commit()
-        await self.db.refresh(job)
         
         return job
     
@@ -582,7 +627,9 @@ class AIGenerationService:
             Updated job with results
         """
         # Get job
-        stmt = select(AIGenerationJob).where(AIGenerationJob.id == job_id)
+        stmt = select(AIGenerationJob).where(
+            AIGenerationJob.id == job_id
+        ).options(undefer_group("content"))
         result = await self.db.execute(stmt)
         job = result.scalar_one_or_none()
         
@@ -697,20 +744,29 @@ class AIGenerationService:
         self,
         campaign_id: uuid.UUID,
         organization_id: uuid.UUID,
-        page: int = 1,
-        per_page: int = 20
-    ) -> tuple[List[AIGenerationJob], int]:
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+        job_type: Optional[AIJobType] = None,
+        status: Optional[AIJobStatus] = None,
+        created_after: Optional[datetime] = None
+    ) -> tuple[List[AIGenerationJob], Optional[str]]:
         """
-        List generation jobs for a campaign
+        List generation jobs for a campaign using keyset pagination
         
         Args:
             campaign_id: Campaign UUID
             organization_id: Organization UUID
-            page: Page number
             per_page: Items per page
+            cursor: Cursor returned for the previous page, if any
+            job_type: Only include jobs of this type
+            status: Only include jobs in this status
+            created_after: Only include jobs created after this time
             
         Returns:
-            Tuple of (jobs list, total count)
+            Tuple of (jobs list, next cursor or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Verify campaign
         campaign_stmt = select(Campaign).where(
@@ -723,29 +779,41 @@ class AIGenerationService:
         campaign = campaign_result.scalar_one_or_none()
         
         if not campaign:
-            return [], 0
+            return [], None
+        
+        # Filters are applied in SQL so pages come straight off ix_aijob_campaign_created
+        filters = [AIGenerationJob.campaign_id == campaign_id]
+        if job_type:
+            filters.append(AIGenerationJob.job_type == job_type.value)
+        if status:
+            filters.append(AIGenerationJob.status == status.value)
+        if created_after:
+            filters.append(AIGenerationJob.created_at > created_after)
+        
+        # Get jobs, fetching one extra row to detect a following page
+        stmt = select(AIGenerationJob).where(*filters)
+        
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(AIGenerationJob.created_at, AIGenerationJob.id) < tuple_(cursor_created_at, cursor_id)
+            )
         
-        # Count query
-        from sqlalchemy import func
-        count_query = select(func.count()).select_from(AIGenerationJob).where(
-            AIGenerationJob.campaign_id == campaign_id
-        )
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+        stmt = stmt.order_by(
+            AIGenerationJob.created_at.desc(),
+            AIGenerationJob.id.desc()
+        ).limit(per_page + 1)
         
-        # Get jobs
-        offset = (page - 1) * per_page
-        stmt = (
-            select(AIGenerationJob)
-            .where(AIGenerationJob.campaign_id == campaign_id)
-            .order_by(AIGenerationJob.created_at.desc())
-            .offset(offset)
-            .limit(per_page)
-        )
         result = await self.db.execute(stmt)
-        jobs = result.scalars().all()
+        jobs = list(result.scalars().all())
+        
+        next_cursor = None
+        if len(jobs) > per_page:
+            jobs = jobs[:per_page]
+            last = jobs[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
         
-        return list(jobs), total
+        return jobs, next_cursor
     
     async def cancel_job(
         self,
@@ -776,6 +844,35 @@ class AIGenerationService:
         job.completed_at = datetime.utcnow()
         
         await self.db.commit()
-        await self.db.refresh(job)
+        await publish_job_event(job.id, {"status": job.status, "job_id": str(job.id)})
         
-        return job
\ No newline at end of file
+        return job
+    
+    async def mark_job_failed(
+        self,
+        job_id: uuid.UUID,
+        error_message: str
+    ) -> None:
+        """
+        Fail a job that is still pending, e.g. because it could not be enqueued
+        
+        Args:
+            job_id: Job UUID
+            error_message: Reason stored on the job
+        """
+        await self.db.execute(
+            update(AIGenerationJob)
+            .where(
+                and_(
+                    AIGenerationJob.id == job_id,
+                    AIGenerationJob.status == AIJobStatus.PENDING.value
+                )
+            )
+            .values(
+                status=AIJobStatus.FAILED.value,
+                error_message=error_message,
+                completed_at=datetime.utcnow()
+            )
+        )
+        await self.db.commit()
+        await publish_job_event(job_id, {"status": AIJobStatus.FAILED.value, "job_id": str(job_id)})
\ No newline at end of file
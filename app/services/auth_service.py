@@ -2,7 +2,7 @@
 Authentication service layer
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from typing import Optional, Tuple
 from datetime import datetime, timedelta
 import uuid
@@ -11,8 +11,8 @@ from models.user import User
 from models.organization import Organization
 from schemas.auth import UserRegister, UserLogin
 from core.security import (
-    hash_password,
-    verify_password,
+    ahash_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
     create_password_reset_token,
@@ -45,9 +45,7 @@ class AuthService:
             ValueError: If email already exists
         """
         # Check if user already exists
-        stmt = select(User).where(User.email == user_data.email)
-        result = await self.db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
+        existing_user = await self.get_user_by_email(user_data.email)
         
         if existing_user:
             raise ValueError("Email already registered")
@@ -83,7 +81,7 @@ class AuthService:
             organization_id=organization.id,
             email=user_data.email,
             full_name=user_data.full_name,
-            password_hash=hash_password(user_data.password),
+            password_hash=await ahash_password(user_data.password),
             role="owner",  # First user is owner
             is_active=True
         )
@@ -109,15 +107,13 @@ class AuthService:
             User object if authentication successful, None otherwise
         """
         # Get user by email
-        stmt = select(User).where(User.email == login_data.email)
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await self.get_user_by_email(login_data.email)
         
         if not user:
             return None
         
         # Verify password
-        if not verify_password(login_data.password, user.password_hash):
+        if not await averify_password(login_data.password, user.password_hash):
             return None
         
         # Check if user is active
@@ -183,9 +179,7 @@ class AuthService:
             return None
         
         # Get user
-        stmt = select(User).where(User.id == uuid.UUID(user_id))
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await self.get_user_by_id(uuid.UUID(user_id))
         
         if not user or not user.is_active:
             return None
@@ -203,7 +197,9 @@ class AuthService:
         Returns:
             User object or None
         """
-        stmt = select(User).where(User.id == user_id)
+        # Runs on every authenticated request; lambda_stmt caches the
+        # statement itself, not just its compiled SQL
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -217,7 +213,7 @@ class AuthService:
         Returns:
             User object or None
         """
-        stmt = select(User).where(User.email == email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -270,7 +266,7 @@ class AuthService:
             return False
         
         # Update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await ahash_password(new_password)
         await self.db.commit()
         
         return True
@@ -298,11 +294,11 @@ class AuthService:
             return False
         
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not await averify_password(current_password, user.password_hash):
             return False
         
         # Update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await ahash_password(new_password)
         await self.db.commit()
         
         return True
\ No newline at end of file
@@ -2,14 +2,15 @@
 Campaign service layer
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc, asc
+from sqlalchemy import select, update, func, and_, desc, asc, tuple_, any_, literal, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert, ARRAY, UUID
 from sqlalchemy.orm import selectinload
 from typing import Optional, List, Tuple
 from datetime import datetime
 import uuid
-import math
 
 from models.campaign import Campaign, CampaignObjective, CampaignStatus
+from models.contact import Contact, CampaignRecipient, SubscriptionStatus
 from models.user import User
 from schemas.campaign import (
     CampaignCreate,
@@ -17,7 +18,102 @@ from schemas.campaign import (
     CampaignObjectiveCreate,
     CampaignObjectiveUpdate,
     CampaignStatusEnum,
+    CampaignSortField,
+    SortOrder,
 )
+from core.cache import cache_delete
+from utils.pagination import encode_cursor, decode_cursor
+
+
+# Cache-aside TTLs for campaign reads (entries are also invalidated on writes)
+CAMPAIGN_CACHE_TTL = 300
+CAMPAIGN_STATS_CACHE_TTL = 60
+
+
+class CampaignValidationError(ValueError):
+    """Raised when campaign data is rejected by a business rule"""
+
+
+class InvalidStatusTransition(ValueError):
+    """Raised when a campaign is not in a status that allows the requested change"""
+
+
+# Allowed campaign status transitions (current status -> permitted next statuses)
+ALLOWED_STATUS_TRANSITIONS = {
+    CampaignStatus.DRAFT: [
+        CampaignStatus.GENERATING,
+        CampaignStatus.REVIEW,
+        CampaignStatus.SCHEDULED,
+        CampaignStatus.ARCHIVED
+    ],
+    CampaignStatus.GENERATING: [
+        CampaignStatus.DRAFT,
+        CampaignStatus.REVIEW
+    ],
+    CampaignStatus.REVIEW: [
+        CampaignStatus.DRAFT,
+        CampaignStatus.SCHEDULED,
+        CampaignStatus.ARCHIVED
+    ],
+    CampaignStatus.SCHEDULED: [
+        CampaignStatus.SENDING,
+        CampaignStatus.PAUSED,
+        CampaignStatus.ARCHIVED
+    ],
+    CampaignStatus.SENDING: [
+        CampaignStatus.SENT,
+        CampaignStatus.PAUSED
+    ],
+    CampaignStatus.SENT: [
+        CampaignStatus.ARCHIVED
+    ],
+    CampaignStatus.PAUSED: [
+        CampaignStatus.SCHEDULED,
+        CampaignStatus.SENDING,
+        CampaignStatus.ARCHIVED
+    ],
+    CampaignStatus.ARCHIVED: []
+}
+
+# Reverse lookup (target status -> statuses it may be reached from), used as
+# the WHERE guard of the status UPDATE
+ALLOWED_SOURCE_STATUSES = {
+    target: [
+        source.value for source, targets in ALLOWED_STATUS_TRANSITIONS.items()
+        if target in targets
+    ]
+    for target in CampaignStatus
+}
+
+
+# Prebuilt ORDER BY clauses per (sort_by, order); id breaks ties so pages never overlap
+_CAMPAIGN_SORT_COLUMNS = {
+    "created_at": Campaign.created_at,
+    "updated_at": Campaign.updated_at,
+    "name": Campaign.name,
+    "scheduled_at": Campaign.scheduled_at,
+}
+_ORDER_FUNCS = {"asc": asc, "desc": desc}
+CAMPAIGN_ORDER_BY = {
+    (sort_by, order): (direction(column), direction(Campaign.id))
+    for sort_by, column in _CAMPAIGN_SORT_COLUMNS.items()
+    for order, direction in _ORDER_FUNCS.items()
+}
+
+
+def campaign_cache_key(organization_id: uuid.UUID, campaign_id: uuid.UUID) -> str:
+    """Cache key for a serialized campaign"""
+    return f"camp:{organization_id}:{campaign_id}"
+
+
+def campaign_objectives_cache_key(organization_id: uuid.UUID, campaign_id: uuid.UUID) -> str:
+    """Cache key for a campaign's serialized objectives"""
+    return f"camp:{organization_id}:objs:{campaign_id}"
+
+
+def campaign_stats_cache_key(organization_id: uuid.UUID) -> str:
+    """Cache key for an organization's campaign statistics"""
+    return f"camp:{organization_id}:stats"
 
 
 class CampaignService:
@@ -26,6 +122,24 @@ class CampaignService:
     def __init__(self, db: AsyncSession):
         self.db = db
     
+    async def invalidate_cache(
+        self,
+        organization_id: uuid.UUID,
+        campaign_id: Optional[uuid.UUID] = None
+    ) -> None:
+        """
+        Drop cached campaign reads after a write
+        
+        Args:
+            organization_id: Organization UUID
+            campaign_id: Campaign UUID whose entries to drop (stats only if omitted)
+        """
+        keys = [campaign_stats_cache_key(organization_id)]
+        if campaign_id:
+            keys.append(campaign_cache_key(organization_id, campaign_id))
+            keys.append(campaign_objectives_cache_key(organization_id, campaign_id))
+        await cache_delete(*keys)
+    
     async def create_campaign(
         self,
         organization_id: uuid.UUID,
@@ -74,6 +188,7 @@ class CampaignService:
             self.db.add(objective)
         
         await self.db.commit()
+        await self.invalidate_cache(organization_id)
         await self.db.refresh(campaign)
         
         # Load objectives
@@ -100,8 +215,8 @@ class CampaignService:
         Returns:
             Campaign or None if not found
         """
-        stmt = (
-            select(Campaign)
+        stmt = lambda_stmt(
+            lambda: select(Campaign)
             .where(
                 and_(
                     Campaign.id == campaign_id,
@@ -119,57 +234,64 @@ class CampaignService:
         status: Optional[List[CampaignStatusEnum]] = None,
         page: int = 1,
         per_page: int = 20,
-        sort_by: str = "created_at",
-        order: str = "desc",
-        search: Optional[str] = None
-    ) -> Tuple[List[Campaign], int]:
+        sort_by: CampaignSortField = "created_at",
+        order: SortOrder = "desc",
+        search: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> Tuple[List[Campaign], Optional[int], Optional[str]]:
         """
         List campaigns with filtering and pagination
         
+        Pages are addressed either by page number (OFFSET) or, when sorting by
+        created_at, by an `after` cursor that seeks past the previous page.
+        
         Args:
             organization_id: Organization UUID
             status: Optional list of statuses to filter by
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when `after` is given)
             per_page: Items per page
             sort_by: Field to sort by
             order: Sort order (asc/desc)
             search: Search term for name/description
+            after: Cursor returned as next_cursor by the previous page
             
         Returns:
-            Tuple of (campaigns list, total count)
+            Tuple of (campaigns list, total count, next cursor or None).
+            The total is None for cursor requests, which are not counted.
+            
+        Raises:
+            ValueError: If the cursor is malformed or sort_by is not created_at
         """
-        # Build query
-        query = select(Campaign).where(Campaign.organization_id == organization_id)
+        # Build filters
+        filters = [Campaign.organization_id == organization_id]
         
         # Apply status filter
         if status:
             status_values = [s.value for s in status]
-            query = query.where(Campaign.status.in_(status_values))
+            filters.append(Campaign.status.in_(status_values))
         
-        # Apply search
+        # Apply search (GIN-indexed full-text match on name/description)
         if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    Campaign.name.ilike(search_pattern),
-                    Campaign.description.ilike(search_pattern)
-                )
+            filters.append(
+                Campaign.search_vector.op("@@")(func.plainto_tsquery("english", search))
             )
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
+        # Seek past the previous page instead of using OFFSET
+        if after:
+            if sort_by != "created_at":
+                raise ValueError("Cursor pagination requires sort_by=created_at")
+            return await self._list_campaigns_after(filters, per_page, order, after)
+        
+        offset = (page - 1) * per_page
+        
+        # Total count rides along on every row as a window aggregate, so the
+        # page and the count come back from a single query
+        query = select(Campaign, func.count().over().label("total")).where(*filters)
         
         # Apply sorting
-        sort_column = getattr(Campaign, sort_by, Campaign.created_at)
-        if order == "asc":
-            query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(desc(sort_column))
+        query = query.order_by(*CAMPAIGN_ORDER_BY[(sort_by, order)])
         
         # Apply pagination
-        offset = (page - 1) * per_page
         query = query.offset(offset).limit(per_page)
         
         # Load objectives
@@ -177,9 +299,74 @@ class CampaignService:
         
         # Execute query
         result = await self.db.execute(query)
-        campaigns = result.scalars().all()
+        rows = result.all()
+        campaigns = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0][1]
+        elif offset:
+            # Page past the end: no rows to carry the window count
+            count_query = select(func.count()).select_from(Campaign).where(*filters)
+            total = (await self.db.execute(count_query)).scalar()
+        else:
+            total = 0
+        
+        next_cursor = None
+        if sort_by == "created_at" and campaigns and offset + len(campaigns) < total:
+            last = campaigns[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
         
-        return list(campaigns), total
+        return campaigns, total, next_cursor
+    
+    async def _list_campaigns_after(
+        self,
+        filters: List,
+        per_page: int,
+        order: SortOrder,
+        after: str
+    ) -> Tuple[List[Campaign], None, Optional[str]]:
+        """
+        Fetch the page of campaigns following a created_at cursor
+        
+        Seeks past the previous page instead of using OFFSET, and fetches one
+        extra row to detect a following page rather than counting.
+        
+        Args:
+            filters: Filter conditions built by list_campaigns
+            per_page: Items per page
+            order: Sort order (asc/desc)
+            after: Cursor returned as next_cursor by the previous page
+            
+        Returns:
+            Tuple of (campaigns list, None, next cursor or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        cursor_created_at, cursor_id = decode_cursor(after)
+        position = tuple_(Campaign.created_at, Campaign.id)
+        if order == "asc":
+            seek = position > tuple_(cursor_created_at, cursor_id)
+        else:
+            seek = position < tuple_(cursor_created_at, cursor_id)
+        
+        query = (
+            select(Campaign)
+            .where(*filters, seek)
+            .order_by(*CAMPAIGN_ORDER_BY[("created_at", order)])
+            .limit(per_page + 1)
+            .options(selectinload(Campaign.objectives))
+        )
+        result = await self.db.execute(query)
+        campaigns = list(result.scalars().all())
+        
+        next_cursor = None
+        if len(campaigns) > per_page:
+            campaigns = campaigns[:per_page]
+            last = campaigns[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        
+        return campaigns, None, next_cursor
     
     async def update_campaign(
         self,
@@ -205,7 +392,7 @@ class CampaignService:
         
         # Check if campaign is editable
         if not campaign.is_editable:
-            raise ValueError(f"Cannot edit campaign in {campaign.status.value} status")
+            raise ValueError(f"Cannot edit campaign in {campaign.status} status")
         
         # Update fields
         update_data = campaign_data.model_dump(exclude_unset=True)
@@ -219,6 +406,7 @@ class CampaignService:
         campaign.updated_at = datetime.utcnow()
         
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         await self.db.refresh(campaign)
         
         return campaign
@@ -245,10 +433,11 @@ class CampaignService:
         
         # Check if campaign can be deleted
         if campaign.status in [CampaignStatus.SENDING, CampaignStatus.SENT]:
-            raise ValueError(f"Cannot delete campaign in {campaign.status.value} status")
+            raise ValueError(f"Cannot delete campaign in {campaign.status} status")
         
         await self.db.delete(campaign)
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         
         return True
     
@@ -304,6 +493,7 @@ class CampaignService:
             self.db.add(new_obj)
         
         await self.db.commit()
+        await self.invalidate_cache(organization_id)
         await self.db.refresh(duplicate)
         
         # Load objectives
@@ -324,6 +514,10 @@ class CampaignService:
         """
         Change campaign status
         
+        The transition is checked and applied by a single conditional
+        UPDATE ... RETURNING; the campaign is only read separately when the
+        update matches nothing, to tell "not found" from "not allowed".
+        
         Args:
             campaign_id: Campaign UUID
             organization_id: Organization UUID
@@ -331,75 +525,48 @@ class CampaignService:
             
         Returns:
             Updated campaign or None if not found
+            
+        Raises:
+            InvalidStatusTransition: If the transition from the current status
+                is not allowed (e.g. a concurrent request already changed it)
         """
-        campaign = await self.get_campaign(campaign_id, organization_id)
+        target_status = CampaignStatus(new_status.value)
+        values = {"status": target_status.value, "updated_at": datetime.utcnow()}
         
-        if not campaign:
-            return None
-        
-        # Validate status transition
-        self._validate_status_transition(campaign.status, new_status)
+        # Set sent_at if sending
+        if target_status == CampaignStatus.SENT:
+            values["sent_at"] = datetime.utcnow()
         
-        campaign.status = new_status
-        campaign.updated_at = datetime.utcnow()
+        stmt = (
+            update(Campaign)
+            .where(
+                and_(
+                    Campaign.id == campaign_id,
+                    Campaign.organization_id == organization_id,
+                    Campaign.status.in_(ALLOWED_SOURCE_STATUSES[target_status])
+                )
+            )
+            .values(**values)
+            .returning(Campaign)
+            .options(selectinload(Campaign.objectives))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        campaign = result.scalar_one_or_none()
         
-        # Set sent_at if sending
-        if new_status == CampaignStatusEnum.SENT:
-            campaign.sent_at = datetime.utcnow()
+        if not campaign:
+            existing = await self.get_campaign(campaign_id, organization_id)
+            if not existing:
+                return None
+            raise InvalidStatusTransition(
+                f"Cannot transition from {existing.status} to {new_status.value}"
+            )
         
         await self.db.commit()
-        await self.db.refresh(campaign)
+        await self.invalidate_cache(organization_id, campaign_id)
         
         return campaign
     
-    def _validate_status_transition(
-        self,
-        current_status: CampaignStatus,
-        new_status: CampaignStatusEnum
-    ):
-        """Validate if status transition is allowed"""
-        # Define allowed transitions
-        allowed_transitions = {
-            CampaignStatus.DRAFT: [
-                CampaignStatusEnum.GENERATING,
-                CampaignStatusEnum.REVIEW,
-                CampaignStatusEnum.SCHEDULED,
-                CampaignStatusEnum.ARCHIVED
-            ],
-            CampaignStatus.GENERATING: [
-                CampaignStatusEnum.DRAFT,
-                CampaignStatusEnum.REVIEW
-            ],
-            CampaignStatus.REVIEW: [
-                CampaignStatusEnum.DRAFT,
-                CampaignStatusEnum.SCHEDULED,
-                CampaignStatusEnum.ARCHIVED
-            ],
-            CampaignStatus.SCHEDULED: [
-                CampaignStatusEnum.SENDING,
-                CampaignStatusEnum.PAUSED,
-                CampaignStatusEnum.ARCHIVED
-            ],
-            CampaignStatus.SENDING: [
-                CampaignStatusEnum.SENT,
-                CampaignStatusEnum.PAUSED
-            ],
-            CampaignStatus.SENT: [
-                CampaignStatusEnum.ARCHIVED
-            ],
-            CampaignStatus.PAUSED: [
-                CampaignStatusEnum.SCHEDULED,
-                CampaignStatusEnum.SENDING,
-                CampaignStatusEnum.ARCHIVED
-            ],
-            CampaignStatus.ARCHIVED: []
-        }
-        
-        if new_status not in allowed_transitions.get(current_status, []):
-            raise ValueError(
-                f"Cannot transition from {current_status.value} to {new_status.value}"
-            )
-    
     async def schedule_campaign(
         self,
         campaign_id: uuid.UUID,
@@ -424,17 +591,101 @@ class CampaignService:
         
         # Validate scheduled time
         if scheduled_at <= datetime.utcnow():
-            raise ValueError("Scheduled time must be in the future")
+            raise CampaignValidationError("Scheduled time must be in the future")
         
         campaign.scheduled_at = scheduled_at
         campaign.status = CampaignStatus.SCHEDULED
         campaign.updated_at = datetime.utcnow()
         
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         await self.db.refresh(campaign)
         
         return campaign
     
+    async def cancel_campaign(
+        self,
+        campaign_id: uuid.UUID,
+        organization_id: uuid.UUID
+    ) -> Optional[Campaign]:
+        """
+        Return a scheduled or paused campaign to draft and clear its schedule
+        
+        Args:
+            campaign_id: Campaign UUID
+            organization_id: Organization UUID
+        
+        Returns:
+            Updated campaign or None if not found
+        
+        Raises:
+            ValueError: If the campaign is not scheduled or paused
+        """
+        stmt = (
+            update(Campaign)
+            .where(
+                and_(
+                    Campaign.id == campaign_id,
+                    Campaign.organization_id == organization_id,
+                    Campaign.status.in_([CampaignStatus.SCHEDULED.value, CampaignStatus.PAUSED.value])
+                )
+            )
+            .values(
+                status=CampaignStatus.DRAFT.value,
+                scheduled_at=None,
+                updated_at=datetime.utcnow()
+            )
+            .returning(Campaign)
+            .options(selectinload(Campaign.objectives))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        campaign = result.scalar_one_or_none()
+        
+        if not campaign:
+            # Only pay for the extra lookup on the failure path
+            existing = await self.get_campaign(campaign_id, organization_id)
+            if not existing:
+                return None
+            raise ValueError(f"Cannot cancel a campaign in {existing.status} status")
+        
+        await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
+        
+        return campaign
+
+    async def increment_generation_iterations(
+        self,
+        campaign_id: uuid.UUID,
+        organization_id: uuid.UUID
+    ) -> Optional[int]:
+        """
+        Atomically bump the campaign's generation iteration counter
+        
+        Does not commit; the caller owns the transaction.
+        
+        Args:
+            campaign_id: Campaign UUID
+            organization_id: Organization UUID
+            
+        Returns:
+            New iteration count or None if campaign not found
+        """
+        stmt = (
+            update(Campaign)
+            .where(
+                and_(
+                    Campaign.id == campaign_id,
+                    Campaign.organization_id == organization_id
+                )
+            )
+            .values(generation_iterations=Campaign.generation_iterations + 1)
+            .returning(Campaign.generation_iterations)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def get_campaign_stats(
         self,
         organization_id: uuid.UUID
@@ -448,18 +699,12 @@ class CampaignService:
         Returns:
             Dictionary with campaign statistics
         """
-        # Get total count
-        total_query = select(func.count()).select_from(Campaign).where(
-            Campaign.organization_id == organization_id
-        )
-        total_result = await self.db.execute(total_query)
-        total = total_result.scalar()
-        
-        # Get counts by status
+        # Get counts by status; a single pass over the (organization_id, status)
+        # index, the total is their sum
         status_query = (
             select(
                 Campaign.status,
-                func.count(Campaign.id)
+                func.count()
             )
             .where(Campaign.organization_id == organization_id)
             .group_by(Campaign.status)
@@ -468,7 +713,7 @@ class CampaignService:
         status_counts = {status: count for status, count in status_result}
         
         return {
-            "total_campaigns": total,
+            "total_campaigns": sum(status_counts.values()),
             "draft": status_counts.get(CampaignStatus.DRAFT, 0),
             "scheduled": status_counts.get(CampaignStatus.SCHEDULED, 0),
             "sent": status_counts.get(CampaignStatus.SENT, 0),
@@ -479,10 +724,107 @@ class CampaignService:
             "archived": status_counts.get(CampaignStatus.ARCHIVED, 0)
         }
     
+    # ============================================
+    # CAMPAIGN RECIPIENTS
+    # ============================================
+    
+    async def add_recipients(
+        self,
+        campaign_id: uuid.UUID,
+        organization_id: uuid.UUID,
+        contact_ids: List[uuid.UUID]
+    ) -> Optional[int]:
+        """
+        Add contacts to a campaign's recipients
+        
+        Recipients are created by one INSERT ... SELECT from contacts rather
+        than one ORM insert per contact. Contacts from other organizations or
+        not subscribed are skipped, as are contacts already on the campaign.
+        
+        Args:
+            campaign_id: Campaign UUID
+            organization_id: Organization UUID (for access control)
+            contact_ids: Contact UUIDs to add
+            
+        Returns:
+            Number of recipients added or None if campaign not found
+        """
+        campaign = await self.get_campaign(campaign_id, organization_id)
+        
+        if not campaign:
+            return None
+        
+        if not campaign.is_editable:
+            raise ValueError(f"Cannot add recipients to campaign in {campaign.status} status")
+        
+        # id, send_status and unsubscribed come from the column server defaults
+        contacts = select(
+            literal(campaign_id, UUID(as_uuid=True)),
+            literal(organization_id, UUID(as_uuid=True)),
+            Contact.id
+        ).where(
+            and_(
+                Contact.organization_id == organization_id,
+                # One array parameter; IN would bind a parameter per contact
+                Contact.id == any_(literal(contact_ids, ARRAY(UUID(as_uuid=True)))),
+                Contact.subscription_status == SubscriptionStatus.SUBSCRIBED
+            )
+        )
+        stmt = (
+            pg_insert(CampaignRecipient)
+            .from_select(
+                ["campaign_id", "organization_id", "contact_id"],
+                contacts,
+                # Python-side defaults would bind one value for every row
+                include_defaults=False
+            )
+            .on_conflict_do_nothing(constraint="uq_campaign_contact")
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        
+        return result.rowcount
+    
     # ============================================
     # CAMPAIGN OBJECTIVES
     # ============================================
     
+    async def get_objectives(
+        self,
+        campaign_id: uuid.UUID,
+        organization_id: uuid.UUID
+    ) -> Optional[List[CampaignObjective]]:
+        """
+        Get a campaign's objectives in a single query
+        
+        Outer-joins from the campaign so an existing campaign without
+        objectives can be told apart from a missing one.
+        
+        Args:
+            campaign_id: Campaign UUID
+            organization_id: Organization UUID (for access control)
+            
+        Returns:
+            List of objectives or None if campaign not found
+        """
+        stmt = (
+            select(Campaign.id, CampaignObjective)
+            .outerjoin(CampaignObjective, CampaignObjective.campaign_id == Campaign.id)
+            .where(
+                and_(
+                    Campaign.id == campaign_id,
+                    Campaign.organization_id == organization_id
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+        
+        if not rows:
+            return None
+        
+        return [objective for _, objective in rows if objective is not None]
+    
     async def create_objective(
         self,
         campaign_id: uuid.UUID,
@@ -516,6 +858,7 @@ class CampaignService:
         )
         self.db.add(objective)
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         await self.db.refresh(objective)
         
         return objective
@@ -567,6 +910,7 @@ class CampaignService:
                     setattr(objective, field, value)
         
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         await self.db.refresh(objective)
         
         return objective
@@ -608,5 +952,6 @@ class CampaignService:
         
         await self.db.delete(objective)
         await self.db.commit()
+        await self.invalidate_cache(organization_id, campaign_id)
         
         return True
\ No newline at end of file
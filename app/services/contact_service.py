@@ -0,0 +1,121 @@
+"""
+Contact service layer
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from typing import Any, Dict, Iterable
+import uuid
+
+import orjson
+
+
+# Contact fields accepted from an import file, in COPY column order
+IMPORT_FIELDS = (
+    "email",
+    "first_name",
+    "last_name",
+    "company",
+    "job_title",
+    "tags",
+    "custom_fields",
+)
+
+# Staging table for a single import; dropped with the transaction
+CREATE_IMPORT_TABLE_SQL = text("""
+    CREATE TEMP TABLE contacts_import (
+        email varchar(255) NOT NULL,
+        first_name varchar(100),
+        last_name varchar(100),
+        company varchar(255),
+        job_title varchar(255),
+        tags text[],
+        custom_fields jsonb
+    ) ON COMMIT DROP
+""")
+
+# New contacts are inserted, with id, subscription status and verification
+# from the column defaults; existing ones get the imported profile fields
+# (missing values keep what is stored). Subscription status is never touched,
+# so an import cannot resubscribe anyone.
+UPSERT_IMPORTED_CONTACTS_SQL = text("""
+    INSERT INTO contacts AS c (
+        organization_id, email, first_name, last_name, company, job_title,
+        tags, custom_fields
+    )
+    SELECT
+        CAST(:organization_id AS uuid), email, first_name, last_name,
+        company, job_title, tags, custom_fields
+    FROM contacts_import
+    ON CONFLICT (organization_id, email) DO UPDATE SET
+        first_name = COALESCE(EXCLUDED.first_name, c.first_name),
+        last_name = COALESCE(EXCLUDED.last_name, c.last_name),
+        company = COALESCE(EXCLUDED.company, c.company),
+        job_title = COALESCE(EXCLUDED.job_title, c.job_title),
+        tags = COALESCE(EXCLUDED.tags, c.tags),
+        custom_fields = COALESCE(EXCLUDED.custom_fields, c.custom_fields),
+        updated_at = now()
+""")
+
+
+class ContactService:
+    """Service for contact management operations"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def bulk_import(
+        self,
+        organization_id: uuid.UUID,
+        records: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert or update contacts from an uploaded list
+        
+        Rows are streamed into a temporary table with a single binary COPY and
+        merged into contacts with one INSERT ... ON CONFLICT, instead of one
+        INSERT per contact.
+        
+        Args:
+            organization_id: Organization UUID
+            records: Contact dicts with an "email" key and any of the other
+                IMPORT_FIELDS; later rows win for a repeated email
+        
+        Returns:
+            Number of contacts inserted or updated
+        """
+        # ON CONFLICT cannot update the same row twice in one statement
+        rows_by_email = {}
+        for record in records:
+            custom_fields = record.get("custom_fields")
+            rows_by_email[record["email"]] = (
+                record["email"],
+                record.get("first_name"),
+                record.get("last_name"),
+                record.get("company"),
+                record.get("job_title"),
+                record.get("tags"),
+                # The dialect's jsonb codec takes serialized JSON
+                orjson.dumps(custom_fields).decode() if custom_fields is not None else None,
+            )
+        
+        if not rows_by_email:
+            return 0
+        
+        await self.db.execute(CREATE_IMPORT_TABLE_SQL)
+        
+        # COPY runs on the session's own connection, inside its transaction
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "contacts_import",
+            records=rows_by_email.values(),
+            columns=IMPORT_FIELDS
+        )
+        
+        result = await self.db.execute(
+            UPSERT_IMPORTED_CONTACTS_SQL,
+            {"organization_id": organization_id}
+        )
+        await self.db.commit()
+        
+        return result.rowcount
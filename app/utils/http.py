@@ -0,0 +1,51 @@
+"""
+Conditional GET helpers (ETag / If-None-Match)
+"""
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+# Clients may keep a copy but must revalidate it before every use
+REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Weak ETag derived from a serialized response body
+
+    Args:
+        body: Response body bytes
+
+    Returns:
+        Weak ETag header value
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+def conditional_json_response(request: Request, body: bytes) -> Response:
+    """
+    Return a pre-serialized JSON body, or 304 if the client's copy is current
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Serialized JSON body
+
+    Returns:
+        200 response with the body, or an empty 304 response
+    """
+    etag = body_etag(body)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -5,15 +5,22 @@ import asyncio
 from celery import Task
 from workers.celery_app import celery_app
 from core.database import AsyncSessionLocal
+from core.cache import publish_job_event
 from services.ai_generation_service import AIGenerationService
 import uuid
 
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:  # uvloop is not available on Windows
+    _loop_factory = None
+
 
 class AsyncTask(Task):
     """Base task with async support"""
     
     def __call__(self, *args, **kwargs):
-        return asyncio.run(self.run(*args, **kwargs))
+        return asyncio.run(self.run(*args, **kwargs), loop_factory=_loop_factory)
     
     async def run(self, *args, **kwargs):
         raise NotImplementedError()
@@ -32,17 +39,20 @@ async def process_email_generation(self, job_id: str):
         
         try:
             job = await ai_service.process_generation_job(uuid.UUID(job_id))
-            return {
+            outcome = {
                 "status": "completed",
                 "job_id": str(job.id),
                 "variants_count": len(job.generated_content.get('variants', []))
             }
         except Exception as e:
-            return {
+            outcome = {
                 "status": "failed",
                 "job_id": job_id,
                 "error": str(e)
             }
+    
+    await publish_job_event(job_id, outcome)
+    return outcome
 
 
 @celery_app.task(base=AsyncTask, bind=True, name="process_email_refinement")
@@ -58,16 +68,19 @@ async def process_email_refinement(self, job_id: str):
         
         try:
             job = await ai_service.process_refinement_job(uuid.UUID(job_id))
-            return {
+            outcome = {
                 "status": "completed",
                 "job_id": str(job.id)
             }
         except Exception as e:
-            return {
+            outcome = {
                 "status": "failed",
                 "job_id": job_id,
                 "error": str(e)
             }
+    
+    await publish_job_event(job_id, outcome)
+    return outcome
 
 
 @celery_app.task(base=AsyncTask, bind=True, name="process_subject_line_generation")
@@ -83,14 +96,17 @@ async def process_subject_line_generation(self, job_id: str):
         
         try:
             job = await ai_service.process_subject_line_job(uuid.UUID(job_id))
-            return {
+            outcome = {
                 "status": "completed",
                 "job_id": str(job.id),
                 "variants_count": len(job.generated_content.get('variants', []))
             }
         except Exception as e:
-            return {
+            outcome = {
                 "status": "failed",
                 "job_id": job_id,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    await publish_job_event(job_id, outcome)
+    return outcome
\ No newline at end of file
@@ -9,7 +9,7 @@ celery_app = Celery(
     "email_campaign_worker",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["workers.ai_generation_tasks"]
+    include=["workers.ai_generation_tasks", "workers.maintenance_tasks"]
 )
 
 # Configure Celery
@@ -22,6 +22,8 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=300,  # 5 minutes
     task_soft_time_limit=270,  # 4.5 minutes
+    broker_pool_limit=50,  # Shared producer/connection pool for API-side dispatch
+    broker_transport_options={"socket_keepalive": True},
 )
 
 # Optional: Configure task routes
@@ -30,4 +32,18 @@ celery_app.conf.task_routes = {
     "process_email_generation": {"queue": "ai_generation"},
     "process_email_refinement": {"queue": "ai_generation"},
     "process_subject_line_generation": {"queue": "ai_generation"},
-}
\ No newline at end of file
+    "ensure_email_event_partitions": {"queue": "maintenance"},
+    "rollup_campaign_recipient_stats": {"queue": "maintenance"},
+}
+
+# Periodic tasks (run with `celery -A workers.celery_app beat`)
+celery_app.conf.beat_schedule = {
+    "ensure-email-event-partitions": {
+        "task": "ensure_email_event_partitions",
+        "schedule": 24 * 60 * 60,  # daily
+    },
+    "rollup-campaign-recipient-stats": {
+        "task": "rollup_campaign_recipient_stats",
+        "schedule": 60,  # every minute
+    },
+}
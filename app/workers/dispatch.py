@@ -0,0 +1,69 @@
+"""
+Enqueue helpers used by the API to hand jobs to the Celery workers
+"""
+import uuid
+from typing import Union
+
+from workers.celery_app import celery_app
+from schemas.ai_generation import AIJobType
+
+
+# Registered task names (see workers/ai_generation_tasks.py)
+EMAIL_GENERATION_TASK = "process_email_generation"
+EMAIL_REFINEMENT_TASK = "process_email_refinement"
+SUBJECT_LINE_GENERATION_TASK = "process_subject_line_generation"
+
+# Job type -> task name, resolved once at import
+_TASK_BY_JOB_TYPE = {
+    AIJobType.INITIAL_GENERATION.value: EMAIL_GENERATION_TASK,
+    AIJobType.REVISION.value: EMAIL_GENERATION_TASK,
+    AIJobType.REFINEMENT.value: EMAIL_REFINEMENT_TASK,
+    AIJobType.SUBJECT_LINE_TEST.value: SUBJECT_LINE_GENERATION_TASK,
+}
+
+# Task name -> publish options, so routing isn't re-resolved on every send
+_SEND_OPTIONS = {
+    task_name: dict(celery_app.conf.task_routes.get(task_name, {}))
+    for task_name in set(_TASK_BY_JOB_TYPE.values())
+}
+
+
+def send_job_task(task_name: str, job_id: Union[str, uuid.UUID]) -> None:
+    """
+    Publish a job task by name on a pooled broker connection
+
+    Uses send_task so the API process does not need to import the worker
+    modules, and reuses a producer from the app's producer pool instead of
+    setting up a broker connection per request.
+
+    Args:
+        task_name: Registered Celery task name
+        job_id: Generation job UUID
+    """
+    with celery_app.producer_or_acquire() as producer:
+        celery_app.send_task(
+            task_name,
+            args=(str(job_id),),
+            producer=producer,
+            **_SEND_OPTIONS.get(task_name, {})
+        )
+
+
+def dispatch_job(job_type: Union[str, AIJobType], job_id: Union[str, uuid.UUID]) -> None:
+    """
+    Enqueue the worker task that processes a generation job
+
+    Publishing is blocking broker I/O; async callers should run this in the
+    threadpool (run_in_threadpool) rather than on the event loop.
+
+    Args:
+        job_type: Job type of the generation job
+        job_id: Generation job UUID
+
+    Raises:
+        ValueError: If no worker task handles the job type
+    """
+    task_name = _TASK_BY_JOB_TYPE.get(AIJobType(job_type).value)
+    if task_name is None:
+        raise ValueError(f"No worker task for job type {job_type}")
+    send_job_task(task_name, job_id)
@@ -0,0 +1,126 @@
+"""
+Celery tasks for periodic database maintenance
+"""
+from sqlalchemy import text
+
+from workers.celery_app import celery_app
+from workers.ai_generation_tasks import AsyncTask
+from core.database import AsyncSessionLocal
+from models.analytics import EmailEventType
+
+
+# Monthly email_events partitions kept ready ahead of the current month
+EMAIL_EVENT_PARTITION_MONTHS_AHEAD = 3
+
+# Watermark row used by the recipient stats rollup
+RECIPIENT_STATS_ROLLUP = "campaign_recipient_stats"
+
+# Events recorded within this many seconds are left for the next run, so rows
+# from transactions still in flight are not skipped past by the watermark
+RECIPIENT_STATS_LAG_SECONDS = 60
+
+# Seeds the watermark on databases created without the migrations (init_db)
+SEED_WATERMARK_SQL = text("""
+    INSERT INTO rollup_watermarks (name, processed_until)
+    VALUES (:name, '-infinity')
+    ON CONFLICT (name) DO NOTHING
+""")
+
+# Folds events recorded since the watermark into campaign_recipient_stats and
+# advances the watermark, in one statement
+ROLLUP_RECIPIENT_STATS_SQL = text("""
+    WITH bounds AS (
+        SELECT processed_until AS since,
+               now() - make_interval(secs => :lag_seconds) AS until
+        FROM rollup_watermarks
+        WHERE name = :name
+        FOR UPDATE
+    ),
+    advance AS (
+        UPDATE rollup_watermarks w
+        SET processed_until = bounds.until
+        FROM bounds
+        WHERE w.name = :name AND bounds.until > bounds.since
+    ),
+    events AS (
+        SELECT
+            e.campaign_recipient_id,
+            count(*) FILTER (WHERE e.event_type = :opened) AS open_count,
+            min(e.occurred_at) FILTER (WHERE e.event_type = :opened) AS first_opened_at,
+            max(e.occurred_at) FILTER (WHERE e.event_type = :opened) AS last_opened_at,
+            count(*) FILTER (WHERE e.event_type = :clicked) AS click_count,
+            min(e.occurred_at) FILTER (WHERE e.event_type = :clicked) AS first_clicked_at,
+            max(e.occurred_at) FILTER (WHERE e.event_type = :clicked) AS last_clicked_at
+        FROM email_events e, bounds
+        WHERE e.created_at >= bounds.since
+          AND e.created_at < bounds.until
+          AND e.event_type IN (:opened, :clicked)
+        GROUP BY e.campaign_recipient_id
+    )
+    INSERT INTO campaign_recipient_stats AS s (
+        campaign_recipient_id, campaign_id,
+        open_count, first_opened_at, last_opened_at,
+        click_count, first_clicked_at, last_clicked_at
+    )
+    SELECT
+        events.campaign_recipient_id, r.campaign_id,
+        events.open_count, events.first_opened_at, events.last_opened_at,
+        events.click_count, events.first_clicked_at, events.last_clicked_at
+    FROM events
+    JOIN campaign_recipients r ON r.id = events.campaign_recipient_id
+    ON CONFLICT (campaign_recipient_id) DO UPDATE SET
+        open_count = s.open_count + EXCLUDED.open_count,
+        first_opened_at = LEAST(s.first_opened_at, EXCLUDED.first_opened_at),
+        last_opened_at = GREATEST(s.last_opened_at, EXCLUDED.last_opened_at),
+        click_count = s.click_count + EXCLUDED.click_count,
+        first_clicked_at = LEAST(s.first_clicked_at, EXCLUDED.first_clicked_at),
+        last_clicked_at = GREATEST(s.last_clicked_at, EXCLUDED.last_clicked_at),
+        updated_at = now()
+""")
+
+
+@celery_app.task(base=AsyncTask, bind=True, name="ensure_email_event_partitions")
+async def ensure_email_event_partitions(self):
+    """
+    Create the email_events partitions for the current and upcoming months
+    
+    Relies on the ensure_email_events_partition() SQL function created by the
+    partitioning migration; existing partitions are left untouched.
+    """
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("""
+                SELECT ensure_email_events_partition(
+                    (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => m))::date
+                )
+                FROM generate_series(0, :months_ahead) AS m
+            """),
+            {"months_ahead": EMAIL_EVENT_PARTITION_MONTHS_AHEAD}
+        )
+        await db.commit()
+    
+    return {"status": "completed", "months_ahead": EMAIL_EVENT_PARTITION_MONTHS_AHEAD}
+
+
+@celery_app.task(base=AsyncTask, bind=True, name="rollup_campaign_recipient_stats")
+async def rollup_campaign_recipient_stats(self):
+    """
+    Fold newly recorded open/click events into campaign_recipient_stats
+    
+    Only events recorded since the last run are aggregated; the watermark is
+    advanced in the same statement, so each event is counted exactly once.
+    """
+    async with AsyncSessionLocal() as db:
+        await db.execute(SEED_WATERMARK_SQL, {"name": RECIPIENT_STATS_ROLLUP})
+        result = await db.execute(
+            ROLLUP_RECIPIENT_STATS_SQL,
+            {
+                "name": RECIPIENT_STATS_ROLLUP,
+                "lag_seconds": RECIPIENT_STATS_LAG_SECONDS,
+                "opened": EmailEventType.OPENED.value,
+                "clicked": EmailEventType.CLICKED.value,
+            }
+        )
+        await db.commit()
+    
+    return {"status": "completed", "recipients_updated": result.rowcount}
@@ -7,6 +7,7 @@ import type {
   GenerateSubjectLinesRequest,
   CreateTemplateRequest,
   GenerationJobsListResponse,
+  JobStatus,
 } from '@/types/ai.types';
 
 /**
@@ -39,7 +40,13 @@ export const aiApi = {
    */
   getGenerationJobs: async (
     campaignId: string,
-    params?: { page?: number; per_page?: number }
+    params?: {
+      per_page?: number;
+      cursor?: string;
+      job_type?: string;
+      status?: JobStatus;
+      created_after?: string;
+    }
   ): Promise<GenerationJobsListResponse> => {
     const response = await apiClient.get<GenerationJobsListResponse>(
       `/api/v1/campaigns/${campaignId}/generate`,
@@ -23,6 +23,7 @@ export const campaignsApi = {
     per_page?: number;
     search?: string;
     status?: string;
+    after?: string;
   }): Promise<CampaignListResponse> => {
     const response = await apiClient.get<CampaignListResponse>('/api/v1/campaigns', { params });
     return response.data;
@@ -134,9 +134,8 @@ export interface CreateTemplateRequest {
  * Generation jobs list response
  */
 export interface GenerationJobsListResponse {
-  items: AIGenerationJob[];
-  total: number;
-  page: number;
+  jobs: AIGenerationJob[];
   per_page: number;
-  pages: number;
+  next_cursor: string | null;
+  has_more: boolean;
 }
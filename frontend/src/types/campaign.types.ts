@@ -77,10 +77,11 @@ export interface CampaignUpdate {
  */
 export interface CampaignListResponse {
   campaigns: Campaign[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   per_page: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null;
 }
 
 /**
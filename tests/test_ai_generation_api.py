@@ -0,0 +1,50 @@
+"""
+Job enqueue failure handling tests
+"""
+import asyncio
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+
+from api.v1 import ai_generation
+
+
+class EnqueueJobTests(unittest.TestCase):
+    """_enqueue_job fails the job when the broker publish fails"""
+
+    def setUp(self):
+        self.job = SimpleNamespace(id=uuid.uuid4(), job_type="initial_generation")
+        self.ai_service = SimpleNamespace(mark_job_failed=AsyncMock())
+
+    def test_publishes_job(self):
+        with patch.object(ai_generation, "dispatch_job") as dispatch_job:
+            asyncio.run(ai_generation._enqueue_job(self.ai_service, self.job))
+
+        dispatch_job.assert_called_once_with(self.job.job_type, self.job.id)
+        self.ai_service.mark_job_failed.assert_not_awaited()
+
+    def test_publish_failure_marks_job_failed(self):
+        with patch.object(ai_generation, "dispatch_job", side_effect=ConnectionError("broker down")):
+            with self.assertRaises(HTTPException) as ctx:
+                asyncio.run(ai_generation._enqueue_job(self.ai_service, self.job))
+
+        self.assertEqual(ctx.exception.status_code, 500)
+        job_id, error_message = self.ai_service.mark_job_failed.await_args.args
+        self.assertEqual(job_id, self.job.id)
+        self.assertIn("broker down", error_message)
+
+    def test_publish_failure_still_500s_when_marking_fails(self):
+        self.ai_service.mark_job_failed.side_effect = ConnectionError("db down")
+
+        with patch.object(ai_generation, "dispatch_job", side_effect=ConnectionError("broker down")):
+            with self.assertRaises(HTTPException) as ctx:
+                asyncio.run(ai_generation._enqueue_job(self.ai_service, self.job))
+
+        self.assertEqual(ctx.exception.status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Campaign endpoint tests with the database-backed dependencies overridden
+"""
+import unittest
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from main import app
+from api.deps import get_current_active_user, get_campaign_service
+from services.campaign_service import CampaignService, InvalidStatusTransition
+from utils.pagination import encode_cursor
+
+
+ORG_ID = uuid.uuid4()
+CAMPAIGN_ID = uuid.uuid4()
+CAMPAIGN_BODY = b'{"id":"%s","name":"Q1 Product Launch","status":"draft"}' % str(CAMPAIGN_ID).encode()
+
+
+class CampaignApiTestCase(unittest.TestCase):
+    """Authenticates every request as a member of ORG_ID"""
+
+    service = None
+
+    def setUp(self):
+        user = SimpleNamespace(id=uuid.uuid4(), organization_id=ORG_ID, role="member", is_active=True)
+        app.dependency_overrides[get_current_active_user] = lambda: user
+        app.dependency_overrides[get_campaign_service] = lambda: self.service
+        self.addCleanup(app.dependency_overrides.clear)
+        self.client = TestClient(app)
+
+
+class ConditionalGetTests(CampaignApiTestCase):
+    """ETag / If-None-Match on GET /campaigns/{id}"""
+
+    def setUp(self):
+        super().setUp()
+        cache_get = patch("api.v1.campaigns.cache_get", AsyncMock(return_value=CAMPAIGN_BODY.decode()))
+        cache_get.start()
+        self.addCleanup(cache_get.stop)
+        self.url = f"/api/v1/campaigns/{CAMPAIGN_ID}"
+
+    def test_returns_body_with_etag(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, CAMPAIGN_BODY)
+        self.assertTrue(response.headers["etag"].startswith('W/"'))
+
+    def test_matching_if_none_match_returns_304(self):
+        etag = self.client.get(self.url).headers["etag"]
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+
+    def test_matching_etag_in_list_returns_304(self):
+        etag = self.client.get(self.url).headers["etag"]
+
+        response = self.client.get(self.url, headers={"If-None-Match": f'W/"stale", {etag}'})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_stale_if_none_match_returns_body(self):
+        response = self.client.get(self.url, headers={"If-None-Match": 'W/"stale"'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, CAMPAIGN_BODY)
+
+
+class StatusTransitionTests(CampaignApiTestCase):
+    """Conditional status updates surface conflicts as 409"""
+
+    def test_illegal_transition_returns_409(self):
+        self.service = SimpleNamespace(
+            change_campaign_status=AsyncMock(
+                side_effect=InvalidStatusTransition("Cannot transition from draft to sending")
+            )
+        )
+
+        response = self.client.post(f"/api/v1/campaigns/{CAMPAIGN_ID}/send")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("draft", response.json()["detail"])
+
+    def test_missing_campaign_returns_404(self):
+        self.service = SimpleNamespace(change_campaign_status=AsyncMock(return_value=None))
+
+        response = self.client.post(f"/api/v1/campaigns/{CAMPAIGN_ID}/send")
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CursorListTests(CampaignApiTestCase):
+    """GET /campaigns with an `after` cursor"""
+
+    def setUp(self):
+        super().setUp()
+        self.cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+    def test_cursor_page_is_not_counted(self):
+        next_cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+        self.service = SimpleNamespace(list_campaigns=AsyncMock(return_value=([], None, next_cursor)))
+
+        response = self.client.get("/api/v1/campaigns", params={"after": self.cursor})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["next_cursor"], next_cursor)
+        self.assertIsNone(body["total"])
+        self.assertIsNone(body["page"])
+        self.assertIsNone(body["pages"])
+        self.assertEqual(self.service.list_campaigns.await_args.kwargs["after"], self.cursor)
+
+    def test_cursor_with_other_sort_returns_400(self):
+        self.service = SimpleNamespace(list_campaigns=AsyncMock())
+
+        response = self.client.get("/api/v1/campaigns", params={"after": self.cursor, "sort_by": "name"})
+
+        self.assertEqual(response.status_code, 400)
+        self.service.list_campaigns.assert_not_awaited()
+
+    def test_malformed_cursor_returns_400(self):
+        # The cursor is decoded before any query runs, so no session is needed
+        self.service = CampaignService(db=None)
+
+        response = self.client.get("/api/v1/campaigns", params={"after": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Invalid pagination cursor")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Keyset pagination cursor tests
+"""
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from utils.pagination import encode_cursor, decode_cursor
+
+
+class CursorTests(unittest.TestCase):
+    """encode_cursor / decode_cursor round-trips"""
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 12, 28, 10, 0, 0, 123456, tzinfo=timezone.utc)
+        item_id = uuid.uuid4()
+
+        self.assertEqual(decode_cursor(encode_cursor(created_at, item_id)), (created_at, item_id))
+
+    def test_round_trip_naive_datetime(self):
+        created_at = datetime(2024, 12, 28, 10, 0, 0)
+        item_id = uuid.uuid4()
+
+        self.assertEqual(decode_cursor(encode_cursor(created_at, item_id)), (created_at, item_id))
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+        self.assertNotIn("+", cursor)
+        self.assertNotIn("/", cursor)
+
+    def test_malformed_cursor_raises_value_error(self):
+        for cursor in ["not-a-cursor", "", encode_cursor(datetime.now(), uuid.uuid4())[:-8]]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Password hashing and JWT decoding tests
+"""
+import asyncio
+import unittest
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+from core import security
+from core.security import (
+    hash_password,
+    verify_password,
+    ahash_password,
+    averify_password,
+    create_access_token,
+    decode_token,
+)
+
+
+class PasswordHashingTests(unittest.TestCase):
+    """bcrypt hashing without passlib"""
+
+    def test_hash_and_verify(self):
+        hashed = hash_password("SecurePass123!")
+
+        self.assertTrue(hashed.startswith("$2"))
+        self.assertTrue(verify_password("SecurePass123!", hashed))
+        self.assertFalse(verify_password("WrongPass123!", hashed))
+
+    def test_malformed_hash_does_not_verify(self):
+        self.assertFalse(verify_password("SecurePass123!", "not-a-bcrypt-hash"))
+
+    def test_async_helpers(self):
+        async def round_trip():
+            hashed = await ahash_password("SecurePass123!")
+            return await averify_password("SecurePass123!", hashed)
+
+        self.assertTrue(asyncio.run(round_trip()))
+
+
+class DecodeTokenCacheTests(unittest.TestCase):
+    """decode_token caches verified payloads until the token expires"""
+
+    def setUp(self):
+        security._token_cache.clear()
+        self.token = create_access_token({"sub": str(uuid.uuid4())})
+
+    def test_repeated_decode_verifies_once(self):
+        with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as jwt_decode:
+            first = decode_token(self.token)
+            second = decode_token(self.token)
+
+        self.assertEqual(first, second)
+        self.assertEqual(jwt_decode.call_count, 1)
+
+    def test_cached_payload_is_a_copy(self):
+        decode_token(self.token)["sub"] = "tampered"
+
+        self.assertNotEqual(decode_token(self.token)["sub"], "tampered")
+
+    def test_expired_entry_is_verified_again(self):
+        exp = decode_token(self.token)["exp"]
+
+        with patch.object(security.time, "time", return_value=exp + 1), \
+                patch.object(security.jwt, "decode", wraps=security.jwt.decode) as jwt_decode:
+            decode_token(self.token)
+
+        self.assertEqual(jwt_decode.call_count, 1)
+
+    def test_invalid_tokens_are_rejected_and_not_cached(self):
+        expired = create_access_token({"sub": "x"}, expires_delta=timedelta(seconds=-1))
+
+        self.assertIsNone(decode_token(self.token[:-2]))
+        self.assertIsNone(decode_token(expired))
+        self.assertNotIn(expired, security._token_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()